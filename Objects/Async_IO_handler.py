@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""IO handler which serves players over TCP or Unix sockets with asyncio.
+A client sends a name of its player in the first line, then every line is a move of form "spell [target]".
+All messages of a game are sent to all connected clients, a client which doesn't read them is disconnected.
+"""
+
+import asyncio
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+from Objects.IO_handler import IO_handler
+
+
+class Async_IO_handler(IO_handler):
+    def __init__(self,
+                 host: str="127.0.0.1",
+                 port: int=0,
+                 path: str=None,
+                 deadline: float=60.0,
+                 default_move: Tuple[str, str]=("01", None),
+                 max_buffer: int=1 << 20,
+                 loop: asyncio.AbstractEventLoop=None) -> None:
+        """Moves of all players are read concurrently. When a deadline of a round passes,
+        players who didn't send correct moves get a default move, so a round never waits longer than a deadline.
+
+        Args:
+            host (str, optional): A host of a TCP server. Defaults to "127.0.0.1".
+            port (int, optional): A port of a TCP server. If 0, any free port is used. Defaults to 0.
+            path (str, optional): A path of a Unix socket. If set, it is used instead of TCP. Defaults to None.
+            deadline (float, optional): Seconds to wait for moves in every round. Defaults to 60.0.
+            default_move (Tuple[str, str], optional): A spell and a target for players without a move. Defaults to meditation.
+            max_buffer (int, optional): Bytes of messages which may wait to be sent to a client.
+            A slower client is disconnected, so it can't make the server hold all messages of a game. Defaults to 1 MiB.
+            loop (asyncio.AbstractEventLoop, optional): An event loop for synchronous calls. Defaults to a new loop.
+        """
+        super().__init__(None, None)
+        self._host = host
+        self._port = port
+        self._path = path
+        self._deadline = deadline
+        self._default_move = default_move
+        self._max_buffer = max_buffer
+        self._loop = loop
+        self._server: asyncio.AbstractServer = None
+        self._writers: Dict[str, asyncio.StreamWriter] = dict()
+        self._clients: Set[asyncio.Task] = set()
+        # lines from clients by names of players
+        self._lines: Dict[str, asyncio.Queue] = dict()
+        self._moves = deque()
+        self._pending = None
+        self._round_deadline = 0.0
+
+    @property
+    def address(self):
+        """An address of a server: a tuple (host, port) or a path of a Unix socket.
+        """
+        if self._server is None:
+            return None
+        return self._server.sockets[0].getsockname()
+
+    def _run(self, coroutine):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
+
+    async def start(self) -> None:
+        """Starts a server in a running event loop.
+        """
+        if self._path:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=self._path)
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host=self._host, port=self._port)
+
+    def serve(self) -> None:
+        """Starts a server, when a handler is used synchronously.
+        """
+        self._run(self.start())
+
+    async def aclose(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # clients stop when their connections are closed
+        for writer in list(self._writers.values()):
+            writer.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+
+    def close(self) -> None:
+        self._run(self.aclose())
+        self._loop.close()
+
+    def _get_lines(self, player_name: str) -> asyncio.Queue:
+        if player_name not in self._lines:
+            self._lines[player_name] = asyncio.Queue()
+        return self._lines[player_name]
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        player_name = (await reader.readline()).decode("utf-8").strip()
+        if not player_name or self._game is not None and not self._game.search_player(player_name) \
+                or player_name in self._writers:
+            writer.close()
+            return
+        self._writers[player_name] = writer
+        self._clients.add(asyncio.current_task())
+        lines = self._get_lines(player_name)
+        try:
+            while line := await reader.readline():
+                lines.put_nowait(line.decode("utf-8").strip())
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(asyncio.current_task())
+            if self._writers.get(player_name) is writer:
+                del self._writers[player_name]
+            writer.close()
+
+    def input(self, *args, **kwargs) -> str:
+        raise NotImplementedError("Async_IO_handler reads only moves")
+
+    def print(self, message: str) -> None:
+        data = message.encode("utf-8")
+        # print isn't a coroutine and can't wait for drain, so a buffer of every client is limited instead
+        for player_name, writer in list(self._writers.items()):
+            if writer.is_closing():
+                continue
+            writer.write(data)
+            if writer.transport.get_write_buffer_size() > self._max_buffer:
+                del self._writers[player_name]
+                writer.close()
+
+    async def _collect_moves(self, pending: Iterable[str]) -> None:
+        loop = asyncio.get_running_loop()
+        if pending is not self._pending: # a new round
+            self._pending = pending
+            self._round_deadline = loop.time() + self._deadline
+        names = list(pending)
+        waiters = dict()
+        for player_name in names:
+            lines = self._get_lines(player_name)
+            if lines.empty():
+                waiters[asyncio.ensure_future(lines.get())] = player_name
+            else:
+                self._moves.append(self.parse_move(f"{player_name} {lines.get_nowait()}"))
+        timeout = self._round_deadline - loop.time()
+        if waiters and timeout > 0:
+            done, not_done = await asyncio.wait(waiters, timeout=timeout)
+        else:
+            done, not_done = set(), set(waiters)
+        for waiter in not_done:
+            waiter.cancel()
+        for waiter in done:
+            self._moves.append(self.parse_move(f"{waiters[waiter]} {waiter.result()}"))
+        spell, target = self._default_move
+        for waiter in not_done:
+            self._moves.append({waiters[waiter]: {"spell": spell, "target": target}})
+
+    async def get_move_async(self, pending: Iterable[str]=()) -> dict:
+        if not self._moves:
+            await self._collect_moves(pending)
+        return self._moves.popleft() if self._moves else None
+
+    def get_move(self, pending: Iterable[str]=()) -> dict:
+        if not self._moves:
+            self._run(self._collect_moves(pending))
+        return self._moves.popleft() if self._moves else None
+
+    def _take_moves(self) -> List[dict]:
+        moves = list(self._moves) or [None]
+        self._moves.clear()
+        return moves
+
+    async def get_moves_batch_async(self, pending: Iterable[str]=()) -> List[dict]:
+        if self._batches:
+            return self._batches.popleft()
+        if not self._moves:
+            await self._collect_moves(pending)
+        return self._take_moves()
+
+    def get_moves_batch(self, pending: Iterable[str]=()) -> List[dict]:
+        if self._batches:
+            return self._batches.popleft()
+        if not self._moves:
+            self._run(self._collect_moves(pending))
+        return self._take_moves()
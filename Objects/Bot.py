@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""Bots which choose moves of players by Monte Carlo tree search.
+A bot is a move provider (see Objects.Simulation), so it plays through Headless_IO_handler in place of a human input.
+A tree keeps only moves of a bot player, other players move randomly. States aren't stored in a tree:
+every iteration plays rounds from the root on a fork of a game and reverts them by a rollback (see Game.fork and Game.savepoint).
+Iterations can be run in a process pool: every process searches its own tree from a snapshot of a game,
+and statistics of first moves of all trees are summed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Union
+
+from Objects.Game import Game
+from Objects.IO_handler import Headless_IO_handler
+from Objects.Snapshot import Game_snapshot, dump_game
+from Objects.Spells import SPELLS
+
+# a spell and a target as a game resolves it: a name of a player or names of players of a massive spell
+Move = Tuple[tuple, Union[str, tuple]]
+
+
+def _resolve(spell: tuple, targets: tuple, rng: random.Random=None) -> Union[str, tuple]:
+    # a directed spell gets a random target, others get all targets as a game autotargets them
+    if SPELLS[spell].is_directed:
+        return rng.choice(targets) if rng is not None else None
+    return targets[0] if len(targets) == 1 else targets
+
+def legal_moves(game: Game, player_name: str) -> List[Move]:
+    """Returns all moves which a player can make now: spells of a player with all their targets.
+    Targets are found by rules of a game (Game.autotarget and Game.check_target).
+
+    Args:
+        game (Game): A game.
+        player_name (str): A name of a player.
+
+    Returns:
+        List[Move]: Pairs (spell, target).
+    """
+    moves = list()
+    for spell in game.search_player(player_name).get_spells() or [(0, 1)]: # meditate if there are no spells
+        targets = game.autotarget(player_name, spell)
+        if not targets:
+            continue
+        if SPELLS[spell].is_directed:
+            moves.extend((spell, target) for target in targets if game.check_target(player_name, spell, target))
+        else:
+            moves.append((spell, _resolve(spell, targets)))
+    return moves
+
+def random_move(game: Game, player_name: str, rng: random.Random) -> Move:
+    """Chooses a random spell of a player and a random target for it, like random_policy of Objects.Simulation.
+
+    Returns:
+        Move: A pair (spell, target) or None if a spell has no targets.
+    """
+    spell = rng.choice(game.search_player(player_name).get_spells() or [(0, 1)])
+    targets = game.autotarget(player_name, spell)
+    if not targets:
+        return None
+    return spell, _resolve(spell, targets, rng)
+
+
+class _Node:
+    __slots__ = ("visits", "value", "children")
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.value = 0.0
+        self.children: Dict[Move, _Node] = dict()
+
+
+def _select(node: _Node, moves: List[Move], rng: random.Random, exploration: float) -> Move:
+    """Chooses a move of a node by UCB1. Moves which were never tried are chosen first.
+    A move is None if a player can't move.
+    """
+    if not moves:
+        return None
+    untried = [m for m in moves if m not in node.children]
+    if untried:
+        return rng.choice(untried)
+    log_visits = math.log(node.visits)
+    best_move, best_bound = None, -math.inf
+    for m in moves:
+        child = node.children[m]
+        bound = child.value / child.visits + exploration * math.sqrt(log_visits / child.visits)
+        if bound > best_bound:
+            best_move, best_bound = m, bound
+    return best_move
+
+def _reward(game: Game, team_title: str) -> float:
+    """A share of a team in positive scores of all teams, so it's from 0 to 1.
+    """
+    total = 0
+    team_score = 0
+    for title, score in game.get_standings():
+        if score > 0:
+            total += score
+            if title == team_title:
+                team_score = score
+    return team_score / total if total else 0.5
+
+def _search(game: Game,
+            player_name: str,
+            iterations: int,
+            time_limit: float,
+            depth: int,
+            exploration: float,
+            random_seed: int) -> Tuple[Dict[Move, Tuple[int, float]], int, int, int]:
+    """Searches a move of a player. A game is changed only between a savepoint and a rollback,
+    so it must be a fork or a restored copy of a played game.
+
+    Returns:
+        Tuple[Dict[Move, Tuple[int, float]], int, int, int]: Visits and summed rewards of first moves,
+        a number of iterations, a number of nodes of a tree and its maximum depth.
+    """
+    rng = random.Random(random_seed)
+    deadline = time.perf_counter() + time_limit if time_limit is not None else math.inf
+    team = game.search_player(player_name).team
+    titles = sorted(t.title for t in game.get_teams()) # moves are made in the same order in every iteration
+    root = _Node()
+    tree_size = 1
+    max_depth = 0
+    done = 0
+    while (iterations is None or done < iterations) and (done == 0 or time.perf_counter() < deadline):
+        mark = game.savepoint()
+        game.random.seed(rng.getrandbits(64)) # chances of spells differ in every iteration
+        node = root
+        path = [root]
+        rounds = 0
+        while True:
+            moves = dict()
+            for title in titles:
+                for name in game.get_team(title).active_names:
+                    if name == player_name:
+                        continue
+                    move = random_move(game, name, rng)
+                    if move is not None:
+                        moves[name] = {"spell": move[0], "target": move[1]}
+            can_move = team.is_active(player_name)
+            if node is not None: # moves of a bot are chosen by a tree until a new node is added
+                move = _select(node, legal_moves(game, player_name) if can_move else [], rng, exploration)
+                if move in node.children:
+                    node = node.children[move]
+                    path.append(node)
+                else:
+                    node.children[move] = _Node()
+                    path.append(node.children[move])
+                    tree_size += 1
+                    node = None
+            else:
+                move = random_move(game, player_name, rng) if can_move else None
+            if move is not None:
+                moves[player_name] = {"spell": move[0], "target": move[1]}
+            game.play_round(moves)
+            rounds += 1
+            if rounds >= depth or game.is_finished:
+                break
+            game.start_round()
+        reward = _reward(game, team.title)
+        for n in path:
+            n.visits += 1
+            n.value += reward
+        max_depth = max(max_depth, len(path) - 1)
+        game.rollback(mark)
+        done += 1
+    return {m: (child.visits, child.value) for m, child in root.children.items()}, done, tree_size, max_depth
+
+def _search_snapshot(snapshot: bytes, player_name: str, *args) -> Tuple[Dict[Move, Tuple[int, float]], int, int, int]:
+    # a game can't be pickled, so a process gets a snapshot
+    game = Game_snapshot(snapshot).restore(loglevel=logging.CRITICAL, io_handler=Headless_IO_handler(dict()))
+    return _search(game, player_name, *args)
+
+
+class Search_stats(NamedTuple):
+    """Statistics of a search of one move.
+    """
+    player_name: str
+    iterations: int
+    elapsed: float
+    tree_size: int
+    max_depth: int
+    visits: int # visits of a chosen move
+
+    @property
+    def rollouts_per_second(self) -> float:
+        return self.iterations / self.elapsed if self.elapsed else 0.0
+
+
+class Mcts_policy:
+    def __init__(self,
+                 iterations: int=200,
+                 time_limit: float=None,
+                 workers: int=0,
+                 depth: int=3,
+                 exploration: float=1.4,
+                 random_seed: int=0) -> None:
+        """Move provider which chooses moves by Monte Carlo tree search. A search stops after a number of iterations
+        or a time limit, whichever is earlier. Every iteration plays depth rounds or until the end of a game
+        and is rewarded by a share of a team of a bot in positive scores of all teams.
+        A search with a number of iterations and without a time limit is reproducible.
+
+        Args:
+            iterations (int, optional): A number of iterations per move, None for no limit. Defaults to 200.
+            time_limit (float, optional): Seconds per move, None for no limit. Defaults to None.
+            workers (int, optional): A number of processes which search in parallel, iterations are divided between them.
+            If 0, a search runs in the current process. Defaults to 0.
+            depth (int, optional): How many rounds an iteration plays. Defaults to 3.
+            exploration (float, optional): An exploration constant of UCB1. Defaults to 1.4.
+            random_seed (int, optional): A seed of a bot. Defaults to 0.
+
+        Raises:
+            ValueError: If there are no limits or a number of workers or a depth is wrong.
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("A search needs a number of iterations or a time limit")
+        if workers < 0:
+            raise ValueError(f"A number of workers should be >= 0, not {workers}")
+        if depth < 1:
+            raise ValueError(f"A depth should be >= 1, not {depth}")
+        self._iterations = iterations
+        self._time_limit = time_limit
+        self._workers = workers
+        self._depth = depth
+        self._exploration = exploration
+        self._rng = random.Random(random_seed)
+        self._executor: ProcessPoolExecutor = None
+        self.last_stats: Search_stats = None
+        # totals of all searches
+        self.searches = 0
+        self.rollouts = 0
+        self.search_time = 0.0
+
+    def __enter__(self) -> Mcts_policy:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # a bot is sent to processes of a simulation without its pool
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def rollouts_per_second(self) -> float:
+        return self.rollouts / self.search_time if self.search_time else 0.0
+
+    def get_stats(self) -> dict:
+        """Returns totals of all searches.
+        """
+        return {
+            "searches": self.searches,
+            "rollouts": self.rollouts,
+            "search_time": self.search_time,
+            "rollouts_per_second": self.rollouts_per_second,
+        }
+
+    def __call__(self, game: Game, player_name: str) -> Tuple[tuple, str]:
+        moves = legal_moves(game, player_name)
+        if not moves:
+            return (0, 1), None
+        if len(moves) > 1:
+            move = self._search(game, player_name, moves)
+        else:
+            move = moves[0]
+        spell, target = move
+        # a game autotargets spells which aren't directed
+        return spell, target if SPELLS[spell].is_directed else None
+
+    def _search(self, game: Game, player_name: str, moves: List[Move]) -> Move:
+        start = time.perf_counter()
+        params = (self._depth, self._exploration)
+        if self._workers:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            snapshot = dump_game(game)
+            iterations = -(-self._iterations // self._workers) if self._iterations is not None else None
+            futures = [self._executor.submit(_search_snapshot, snapshot, player_name, iterations, self._time_limit,
+                                             *params, self._rng.getrandbits(64))
+                       for _ in range(self._workers)]
+            results = [f.result() for f in futures]
+        else:
+            results = [_search(game.fork(), player_name, self._iterations, self._time_limit, *params, self._rng.getrandbits(64))]
+        elapsed = time.perf_counter() - start
+        visits: Dict[Move, int] = dict()
+        values: Dict[Move, float] = dict()
+        for children, _, _, _ in results:
+            for m, (child_visits, child_value) in children.items():
+                visits[m] = visits.get(m, 0) + child_visits
+                values[m] = values.get(m, 0.0) + child_value
+        # the most visited move, ties are broken by rewards and then by an order of legal moves
+        best = max(moves, key=lambda m: (visits.get(m, 0), values.get(m, 0.0)))
+        iterations = sum(r[1] for r in results)
+        self.last_stats = Search_stats(player_name=player_name,
+                                       iterations=iterations,
+                                       elapsed=elapsed,
+                                       tree_size=sum(r[2] for r in results),
+                                       max_depth=max(r[3] for r in results),
+                                       visits=visits.get(best, 0))
+        self.searches += 1
+        self.rollouts += iterations
+        self.search_time += elapsed
+        return best
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""Fan-out of game events to spectators.
+An event is emitted once as keys of a message and its arguments. It's rendered once for every locale which has subscribers,
+and the same bytes object is queued to all subscribers of that locale. Every subscriber has a bounded queue,
+so a slow subscriber loses messages or is disconnected, but never stalls a game.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, Dict, Iterable, Set, Union
+
+from Objects.localization import get_locale
+from Objects.localization.catalog import Message_catalog, get_catalog
+
+_logger = logging.getLogger("Astral")
+
+
+class Overflow_policies:
+    DISCONNECT = 0 # a subscriber is closed when its queue is full
+    DROP_OLDEST = 1 # the oldest messages are dropped
+
+
+class Subscription:
+    def __init__(self, locale: str, max_pending: int=1024, overflow: int=Overflow_policies.DISCONNECT) -> None:
+        """A queue of rendered messages of one subscriber.
+
+        Args:
+            locale (str): A name of a locale of messages.
+            max_pending (int, optional): How many messages can wait in the queue. Defaults to 1024.
+            overflow (int, optional): What to do when the queue is full (see Overflow_policies). Defaults to DISCONNECT.
+        """
+        self.locale = locale
+        self._overflow = overflow
+        self._max_pending = max_pending
+        maxlen = max_pending if overflow == Overflow_policies.DROP_OLDEST else None
+        self._queue: Deque[bytes] = deque(maxlen=maxlen)
+        self._waiter: asyncio.Future = None
+        self._is_closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def put(self, data: bytes) -> None:
+        if self._is_closed:
+            return
+        if len(self._queue) >= self._max_pending:
+            self.dropped += 1
+            if self._overflow == Overflow_policies.DISCONNECT:
+                self.close()
+                return
+        self._queue.append(data)
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def close(self) -> None:
+        """Stops a subscription. Messages which are already queued can be read.
+        """
+        self._is_closed = True
+        self._wake_up()
+
+    def get_nowait(self) -> bytes:
+        """Returns the next message or None if the queue is empty.
+        """
+        return self._queue.popleft() if self._queue else None
+
+    def drain(self) -> bytes:
+        """Returns all queued messages as one bytes object.
+        """
+        data = b"".join(self._queue)
+        self._queue.clear()
+        return data
+
+    async def get(self) -> bytes:
+        """Waits for the next message.
+
+        Returns:
+            bytes: A message or None if a subscription is closed and its queue is empty.
+        """
+        while not self._queue:
+            if self._is_closed:
+                return None
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._queue.popleft()
+
+    async def stream_to(self, writer: asyncio.StreamWriter) -> None:
+        """Writes messages to a stream until a subscription is closed. While a writer drains,
+        new messages wait in the bounded queue.
+
+        Args:
+            writer (asyncio.StreamWriter): A stream of a spectator.
+        """
+        try:
+            while (data := await self.get()) is not None:
+                writer.write(data)
+                if self._queue: # write everything which is ready in one call
+                    writer.write(self.drain())
+                await writer.drain()
+        except ConnectionError:
+            self.close()
+
+
+class Event_broadcaster:
+    def __init__(self, locales: Union[Iterable[str], Dict[str, dict]], fallback: str=None, message_splitter: str="\n") -> None:
+        """Renders events of a game for subscribers of different locales.
+
+        Args:
+            locales (Union[Iterable[str], Dict[str, dict]]): Names of locales or messages by names of locales,
+            e.g. ("rus", "eng") or {"rus": RUS_TEXTS}.
+            fallback (str, optional): A locale of messages which are absent in other locales. Defaults to None.
+            message_splitter (str, optional): A string which is added after every message. Defaults to "\\n".
+        """
+        if not isinstance(locales, dict):
+            locales = {name: get_locale(name) for name in locales}
+        self._catalogs: Dict[str, Message_catalog] = {name: get_catalog(locales[name]) for name in locales}
+        if fallback is not None and fallback not in self._catalogs:
+            raise ValueError(f"Unknown locale {fallback}")
+        self._fallback = fallback
+        self._message_splitter = message_splitter
+        self._subscriptions: Dict[str, Set[Subscription]] = {name: set() for name in locales}
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._subscriptions.values())
+
+    def get_locales(self) -> Iterable[str]:
+        return tuple(self._catalogs)
+
+    def subscribe(self, locale: str, max_pending: int=1024, overflow: int=Overflow_policies.DISCONNECT) -> Subscription:
+        """Adds a subscriber. Arguments are the same as of Subscription.
+
+        Raises:
+            ValueError: If there is no such locale.
+
+        Returns:
+            Subscription: A queue of messages of a subscriber.
+        """
+        if locale not in self._subscriptions:
+            raise ValueError(f"Unknown locale {locale}")
+        subscription = Subscription(locale, max_pending, overflow)
+        self._subscriptions[locale].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        self._subscriptions[subscription.locale].discard(subscription)
+
+    def _render(self, locale: str, message_keys: tuple, format_args: tuple, format_kwargs: dict) -> bytes:
+        template = self._catalogs[locale].get(message_keys)
+        if template is None and self._fallback is not None:
+            template = self._catalogs[self._fallback].get(message_keys)
+        if template is None:
+            _logger.error("There is no message %s in locale %s", message_keys, locale)
+            return None
+        return (template.render(format_args, format_kwargs) + self._message_splitter).encode("utf-8")
+
+    def emit(self, message_keys: tuple, format_args: tuple=(), format_kwargs: dict=None) -> None:
+        """Sends an event to all subscribers. Locales without subscribers are not rendered.
+
+        Args:
+            message_keys (tuple): Keys of a message, e.g. ("events", "new_round").
+            format_args (tuple, optional): Positional arguments of a message. Defaults to ().
+            format_kwargs (dict, optional): Named arguments of a message. Defaults to None.
+        """
+        for locale, subscriptions in self._subscriptions.items():
+            if not subscriptions:
+                continue
+            data = self._render(locale, message_keys, format_args, format_kwargs)
+            if data is None:
+                continue
+            closed = list()
+            for s in subscriptions:
+                s.put(data)
+                if s.is_closed:
+                    closed.append(s)
+            for s in closed:
+                _logger.debug("A subscriber of locale %s is dropped after %s lost messages", locale, s.dropped)
+                subscriptions.discard(s)
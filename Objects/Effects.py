@@ -5,12 +5,195 @@
     is_clearable - can this effect be cleared by simple clear
     type - buff or debuff
     reaction_time - it can work before a round, with action or after a round
+    func - a function which is called in its reaction time for every player with an active effect, or None
+    message - an index of a message in "effects" section of messages, or None
 """
 
+from __future__ import annotations
+
+import heapq
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from random import Random
+
+    from Objects.Player import Player
+    from Objects.Spells import Spell_description
+
+class Effect_reaction_time:
+    BEFORE_ROUND = 0
+    WITH_ACTION = 1
+    AFTER_ROUND = 2
+
+# functions of effects get a player and a random generator of a game and return arguments of a message or None,
+# functions of effects which work with actions also get a spell and return False if it doesn't affect a player
+
+def burn(p: Player, rng: Random) -> dict:
+    p.damage(2)
+    return {"damage": 2}
+
+def poison(p: Player, rng: Random) -> dict:
+    p.damage(1)
+    return {"damage": 1}
+
+def healing(p: Player, rng: Random) -> dict:
+    p.heal(3)
+    return {"healing": 3}
+
+def nightmare(p: Player, rng: Random) -> None:
+    p.set_stunned() # a game removes a stun before the next round
+
+def magic_shield(p: Player, rng: Random, spell: Spell_description) -> bool:
+    from Objects.Spells import Spell_types
+    return spell.type != Spell_types.ATTACK
+
 ALL_EFFECTS = {
-    "mana_resist":   {"is_clearable": True, "type": "buff", "reaction_time": 0},
-    "prophecy":      {"is_clearable": True, "type": "buff", "reaction_time": 0},
-    "falling":       {"is_clearable": True, "type": "debuff", "reaction_time": 0},
-    "levitate":      {"is_clearable": True, "type": "debuff", "reaction_time": 0},
-    "damage_resist": {"is_clearable": True, "type": "debuff", "reaction_time": 0},
+    "mana_resist":   {"is_clearable": True, "type": "buff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": None, "message": None},
+    "prophecy":      {"is_clearable": True, "type": "buff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": None, "message": None},
+    "falling":       {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": None, "message": None},
+    "levitate":      {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": None, "message": None},
+    "damage_resist": {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": None, "message": None},
+    "burn":          {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.AFTER_ROUND, "func": burn, "message": 1},
+    "poison":        {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.AFTER_ROUND, "func": poison, "message": 2},
+    "healing":       {"is_clearable": True, "type": "buff", "reaction_time": Effect_reaction_time.AFTER_ROUND, "func": healing, "message": 3},
+    "nightmare":     {"is_clearable": True, "type": "debuff", "reaction_time": Effect_reaction_time.BEFORE_ROUND, "func": nightmare, "message": None},
+    "magic_shield":  {"is_clearable": True, "type": "buff", "reaction_time": Effect_reaction_time.WITH_ACTION, "func": magic_shield, "message": None},
 }
+# titles of effects with functions by reaction times
+EFFECTS_BY_REACTION_TIME = tuple(
+    tuple(title for title in ALL_EFFECTS if ALL_EFFECTS[title]["reaction_time"] == reaction_time and ALL_EFFECTS[title]["func"])
+    for reaction_time in (Effect_reaction_time.BEFORE_ROUND, Effect_reaction_time.WITH_ACTION, Effect_reaction_time.AFTER_ROUND)
+)
+
+# numbers of effects in order of their creation
+_effects_counter = count()
+
+
+class Effect:
+    """An effect on a player. A timer of an effect is counted from the round when it starts:
+    if a timer < 0, an effect awaits, else it works until a timer < a duration of an effect.
+    is_locked shows is an effect is cleanable. Not the same as is_clearable in an effect description.
+    """
+    __slots__ = ("title", "player", "start", "duration", "is_locked", "number")
+
+    def __init__(self, title: str, player: Player, start: int, duration: int, is_locked: bool) -> None:
+        if title not in ALL_EFFECTS:
+            raise ValueError(f"There is no effect {title}!")
+        self.title = title
+        self.player = player
+        self.start = start
+        self.duration = duration
+        self.is_locked = is_locked
+        self.number = next(_effects_counter)
+
+    def __repr__(self) -> str:
+        return f"<Effect {self.title} of {self.player}>"
+
+    @property
+    def expiry(self) -> int:
+        """A round when an effect stops to work.
+        """
+        return self.start + self.duration
+
+    @property
+    def is_clearable(self) -> bool:
+        return not self.is_locked and ALL_EFFECTS[self.title]["is_clearable"]
+
+    def get_timer(self, round_num: int) -> int:
+        return round_num - self.start
+
+    def dump(self, round_num: int) -> dict:
+        return {"title": self.title, "timer": self.get_timer(round_num), "is_locked": self.is_locked, "duration": self.duration}
+
+    def copy(self, player: Player) -> Effect:
+        """Makes the same effect of another player, e.g. of a copy of a player in a fork of a game.
+        A copy keeps a number of an effect, so effects are ordered in the same way.
+        """
+        effect = Effect.__new__(Effect)
+        effect.title = self.title
+        effect.player = player
+        effect.start = self.start
+        effect.duration = self.duration
+        effect.is_locked = self.is_locked
+        effect.number = self.number
+        return effect
+
+
+class Effect_scheduler:
+    def __init__(self) -> None:
+        """Game-wide queue of effects ordered by a round of expiry and a reaction time,
+        so a tick of a round touches only effects which expire in it.
+        Removed effects stay in the queue and are skipped when they are popped.
+        Effects with functions are also indexed by reaction times and titles, so a phase of a round
+        touches only effects which work in it.
+        """
+        self._round = 0
+        self._queue = list()
+        # effects with functions by reaction times, titles and numbers
+        self._phases: Tuple[Dict[str, Dict[int, Effect]]] = tuple(
+            {title: dict() for title in titles} for titles in EFFECTS_BY_REACTION_TIME
+        )
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    def schedule(self, effect: Effect) -> None:
+        reaction_time = ALL_EFFECTS[effect.title]["reaction_time"]
+        heapq.heappush(self._queue, (effect.expiry, reaction_time, effect.number, effect))
+        same_effects = self._phases[reaction_time].get(effect.title)
+        if same_effects is not None:
+            same_effects[effect.number] = effect
+
+    def get_undo_state(self) -> tuple:
+        """Saves a state of the scheduler for an undo log (see Objects.Undo).
+        """
+        return self._round, list(self._queue), tuple({title: dict(same_effects) for title, same_effects in phase.items()}
+                                                      for phase in self._phases)
+
+    def set_undo_state(self, state: tuple) -> None:
+        self._round, self._queue, self._phases = state
+
+    def discard(self, effect: Effect) -> None:
+        """Removes an effect from the index of phases. A player calls it when an effect is removed.
+
+        Args:
+            effect (Effect): An effect.
+        """
+        same_effects = self._phases[ALL_EFFECTS[effect.title]["reaction_time"]].get(effect.title)
+        if same_effects is not None:
+            same_effects.pop(effect.number, None)
+
+    def get_active(self, reaction_time: int) -> Iterator[Effect]:
+        """Yields effects with functions which work in the current round in a reaction time,
+        in order of titles in ALL_EFFECTS and then in order of creation. Effects can be removed while iterating.
+
+        Args:
+            reaction_time (int): A reaction time from Effect_reaction_time.
+        """
+        for same_effects in self._phases[reaction_time].values():
+            for effect in list(same_effects.values()):
+                if effect.start <= self._round and effect.player is not None:
+                    yield effect
+
+    def tick(self, round_num: int) -> List[Effect]:
+        """Moves the scheduler to a new round and removes effects which stop to work in it.
+
+        Args:
+            round_num (int): A number of a new round.
+
+        Returns:
+            List[Effect]: Expired effects in order of their reaction time.
+        """
+        self._round = round_num
+        expired = list()
+        while self._queue and self._queue[0][0] <= round_num:
+            effect = heapq.heappop(self._queue)[-1]
+            if effect.player is not None: # an effect wasn't removed before
+                effect.player.discard_effect(effect)
+                expired.append(effect)
+        return expired
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""Structured log of events of a game.
+An event is a tuple (round, code, args). Events are kept in a ring buffer and are formatted only when they are read,
+so recording an event costs one tuple and one append. A sink receives events as JSON lines when the log is flushed.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import IO, Deque, Iterator, List, Tuple, Union
+
+from Objects.localization.catalog import Message_catalog
+
+Event = Tuple[int, int, tuple]
+
+
+class Event_codes:
+    RANDOM_SEED = 0 # (seed, )
+    INPUT_MOVE = 1 # (caster, spell, target)
+    MESSAGE = 2 # (message_keys, format_args, format_kwargs)
+    WARNING = 3 # (message_keys, format_args, format_kwargs)
+    ERROR = 4 # (message_keys, format_args, format_kwargs)
+    NO_MESSAGE = 5 # (message_keys, )
+
+EVENT_NAMES = {
+    Event_codes.RANDOM_SEED: "random_seed",
+    Event_codes.INPUT_MOVE: "input_move",
+    Event_codes.MESSAGE: "message",
+    Event_codes.WARNING: "warning",
+    Event_codes.ERROR: "error",
+    Event_codes.NO_MESSAGE: "no_message",
+}
+# templates of events without localized messages
+EVENT_FORMATS = {
+    Event_codes.RANDOM_SEED: "Random seed is %s",
+    Event_codes.INPUT_MOVE: "Input move: %s %s %s",
+    Event_codes.NO_MESSAGE: "There is no message %s",
+}
+MESSAGE_CODES = frozenset((Event_codes.MESSAGE, Event_codes.WARNING, Event_codes.ERROR))
+
+
+class Event_log:
+    def __init__(self, capacity: int=4096, sink: Union[str, IO]=None) -> None:
+        """Keeps the last events of a game.
+
+        Args:
+            capacity (int, optional): How many last events are kept. Defaults to 4096.
+            sink (Union[str, IO], optional): A path or a text file where all events are written as JSON lines
+            when the log is flushed. Defaults to None.
+        """
+        self._events: Deque[Event] = deque(maxlen=capacity)
+        self._catalog: Message_catalog = None
+        self._unsent: List[Event] = list()
+        self._own_sink = isinstance(sink, str)
+        self._sink: IO = open(sink, "w", encoding="utf-8") if self._own_sink else sink
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def __enter__(self) -> Event_log:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def set_catalog(self, catalog: Message_catalog) -> None:
+        """Sets messages which are used to format localized events.
+
+        Args:
+            catalog (Message_catalog): A catalog of a game.
+        """
+        self._catalog = catalog
+
+    def record(self, round_num: int, code: int, args: tuple) -> None:
+        event = (round_num, code, args)
+        self._events.append(event)
+        if self._sink is not None:
+            self._unsent.append(event)
+
+    def format(self, event: Event) -> str:
+        """Makes a line of text from an event.
+
+        Args:
+            event (Event): A tuple (round, code, args).
+
+        Returns:
+            str: A line with a round, a name of an event and its text.
+        """
+        round_num, code, args = event
+        if code in MESSAGE_CODES:
+            message_keys, format_args, format_kwargs = args
+            template = self._catalog.get(message_keys) if self._catalog is not None else None
+            text = template.render(format_args, format_kwargs) if template is not None else f"{message_keys} {format_args}"
+        else:
+            text = EVENT_FORMATS[code] % args
+        return f"{round_num} {EVENT_NAMES[code]}: {text}"
+
+    def get_lines(self) -> List[str]:
+        """Returns kept events as lines of text.
+        """
+        return [self.format(e) for e in self._events]
+
+    @staticmethod
+    def to_json(event: Event) -> str:
+        round_num, code, args = event
+        return json.dumps((round_num, EVENT_NAMES[code], args), ensure_ascii=False, default=str)
+
+    def flush(self) -> None:
+        """Writes events recorded after the last flush to the sink.
+        """
+        if not self._unsent:
+            return
+        self._sink.write("".join(f"{self.to_json(e)}\n" for e in self._unsent))
+        self._sink.flush()
+        self._unsent.clear()
+
+    def close(self) -> None:
+        if self._sink is not None:
+            self.flush()
+            if self._own_sink:
+                self._sink.close()
+            self._sink = None
@@ -2,15 +2,52 @@
 
 import logging
 import random
-from datetime import datetime
-from itertools import chain
-from typing import Dict, Iterable, Set, Union
+from bisect import bisect_left, insort
+from itertools import chain, count
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
-from Objects.IO_handler import IO_handler, Std_IO_handler
-from Objects.Localization import RUS_TEXTS
+from Objects.Effects import ALL_EFFECTS, EFFECTS_BY_REACTION_TIME, Effect_reaction_time, Effect_scheduler
+from Objects.Event_log import EVENT_NAMES, Event_codes
+from Objects.IO_handler import Headless_IO_handler, IO_handler, Std_IO_handler
+from Objects.localization import get_locale
+from Objects.localization.catalog import get_catalog
 from Objects.Player import Player
-from Objects.Spells import Spell_targets, get_all_spells, get_spell_description, use_spell
+from Objects.Spells import SPELL_PRIORITIES, SPELLS, SPELLS_KEYS, Spell_description, Spell_targets
 from Objects.Team import Team
+from Objects.Undo import Undo_log
+from utils import Batched_random
+
+
+# all games write to one logger, numbers of games are used to distinguish them
+_logger = logging.getLogger("Astral")
+_games_counter = count(1)
+# Objects.States imports NumPy, so it's imported when the first spell has many targets
+_Player_group = None
+
+
+def _make_group(players: List[Player]):
+    global _Player_group
+    if _Player_group is None:
+        from Objects.States import Player_group as _Player_group
+    return _Player_group(players)
+
+
+class Game_logger(logging.LoggerAdapter):
+    def __init__(self, name: str, level: int) -> None:
+        """A light logger of a game. It has its own level, but records are handled by the common logger.
+
+        Args:
+            name (str): A name of a game, it's added to messages.
+            level (int): A level of logging.
+        """
+        super().__init__(_logger, {"game": name})
+        self._level = level
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self._level and self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        return f"{self.extra['game']}: {msg}", kwargs
 
 
 class Game:
@@ -20,10 +57,15 @@ class Game:
                 team_size: int=1,
                 rounds: int=30,
                 loglevel: int=logging.WARNING,
-                io_handler: IO_handler=Std_IO_handler(),
+                io_handler: IO_handler=None,
                 random_seed: int=0,
+                batched_random: bool=False,
                 message_splitter: str="\n",
-                messages: dict=RUS_TEXTS,
+                messages: Union[str, dict]="rus",
+                array_states: bool=False,
+                journal=None,
+                broadcaster=None,
+                event_log=None,
                 **player_kwargs) -> None:
         """Main class, which manages teams, spells, moves of players and etc.
 
@@ -35,49 +77,243 @@ class Game:
             team_size (int, optional): A number of players in each team. Used while creating teams. If 0, it will be asked. Defaults to 1.
             rounds (int, optional): A number of rounds. Defaults to 30.
             loglevel (int, optional): A level of logging. Defaults to logging.WARNING.
-            io_handler (IO_handler, optional): Hadler for comfortable IO. Can be overwritten. Defaults to Std_IO_handler().
+            io_handler (IO_handler, optional): Hadler for comfortable IO. Can be overwritten. Defaults to a new Std_IO_handler.
+            random_seed (int, optional): A seed of a random generator of the game. Defaults to 0.
+            batched_random (bool, optional): Draw random numbers by blocks every round (see utils.Batched_random). Defaults to False.
+            array_states (bool, optional): Store stats of all players in NumPy arrays, so massive spells are applied
+            by vectorized operations. Requires NumPy. Defaults to False.
+            journal (Journal_writer, optional): A journal where moves and changes of every round are written. Defaults to None.
+            broadcaster (Event_broadcaster, optional): Messages of the game are also sent to spectators through it. Defaults to None.
+            event_log (Event_log, optional): A log where events of the game are recorded. Defaults to None.
 
         Raises:
             ValueError: If teams is Iterable and consists not Team objects.
         """
-        self._logger = logging.Logger(name=f"Game {datetime.now()}", level=loglevel)
-        self._logger.debug("Logger created")
-        random.seed(random_seed)
-        self._logger.debug(f"Random seed is {random_seed}")
-        self._io_handler = io_handler
+        self._name = f"Game {next(_games_counter)}"
+        self._logger = Game_logger(self._name, loglevel)
+        self._debug = loglevel <= logging.DEBUG # debug events are skipped at once if the level is higher
+        # every game has its own random generator, so games don't affect each other
+        self._random = Batched_random(random_seed) if batched_random else random.Random(random_seed)
+        self._io_handler = io_handler if io_handler is not None else Std_IO_handler()
+        self._io_handler.set_game(self)
         self._rounds = rounds
+        self._round = 0 # the last started round
+        self._event_log = event_log
+        self.log_event(Event_codes.RANDOM_SEED, random_seed)
+        self._journal = journal
+        self._broadcaster = broadcaster
+        if isinstance(messages, str): # a name of a locale
+            messages = get_locale(messages)
         self._messages = messages
+        # messages are compiled once for every locale and found by tuples of keys
+        self._catalog = get_catalog(messages)
+        if event_log is not None:
+            event_log.set_catalog(self._catalog)
+        self._aliases = self._catalog.get_section(("aliases", ), dict())
         self._message_splitter = message_splitter
+        # indexes of players by names and teams by titles, they are filled by teams
+        self._players: Dict[str, Player] = dict()
+        self._team_titles: Dict[str, Team] = dict()
+        # targets for autotargeting: names of alive enemies and allies by titles of teams and names of all alive players,
+        # they are rebuilt only after somebody dies, revives or joins
+        self._targets: Dict[str, Tuple[Tuple[str], Tuple[str]]] = dict()
+        self._alive_players: Tuple[str] = None
+        # pairs (score, title) of all teams in ascending order, teams update them when their scores change
+        self._leaderboard: List[Tuple[int, str]] = list()
+        self._effects_scheduler = Effect_scheduler()
+        # players who are stunned by effects in the current round
+        self._stunned: Set[Player] = set()
+        # states of changed objects for rollbacks to savepoints
+        self._undo_log = Undo_log()
+        self._states = None
+        if array_states:
+            from Objects.States import Array_states
+            self._states = Array_states()
         # initial spells
-        player_kwargs["start_spells"] = {11, 112, 119, 124}
+        player_kwargs["start_spells"] = ((1, 1), (1, 12), (1, 19), (1, 24))
+        # teams are kept in order of joining, so players move and random numbers are drawn in the same order
+        # in every process, whatever hashes of strings are
         if isinstance(teams, dict): # make teams from a dict with names
-            self._teams: Set[Team] = self.make_teams_from_dict(teams)
+            self._teams: List[Team] = self.make_teams_from_dict(teams, **player_kwargs)
         elif isinstance(teams, Iterable): # teams already created
             # additional check what there are Teams
             for t in teams:
                 if not isinstance(t, Team):
                     raise ValueError(f"Iterable object have to consist Team, not {type(t)}")
-            self._teams: Set[Team] = set(teams)
+            self._teams: List[Team] = list(dict.fromkeys(teams))
         else: # create teams
-            self._teams: Set[Team] = self.make_teams(teams_num, team_size, io_handler, **player_kwargs)
-        
+            self._teams: List[Team] = self.make_teams(teams_num, team_size, self._io_handler, **player_kwargs)
+        for t in self._teams:
+            t.set_game(self)
+
+    def __repr__(self) -> str:
+        return f"<{self._name}>"
 
     def run(self) -> None:
         """Runs the game.
         """
-        for round_num in range(1, self._rounds+1):
-            self.print_message(("events", "new_round"), round_num)
-            # get moves of players
-            moves = self.get_moves()
-            for caster_name in sorted(moves, key=lambda caster_name: get_spell_description(*moves[caster_name]["spell"])["priority"]):
-                pass
-        # the end of a game
+        self.start()
+        try:
+            while not self.is_finished:
+                self.start_round()
+                self.play_round(self.get_moves())
+            self.finish()
+        finally:
+            self._io_handler.flush()
+
+    async def run_async(self) -> None:
+        """Runs the game in an event loop. Moves are awaited without blocking the loop,
+        and the game gives way to other tasks after every round.
+        """
+        import asyncio # it's slow to import, and only games in an event loop need it
+        self.start()
+        try:
+            while not self.is_finished:
+                self.start_round()
+                self.play_round(await self.get_moves_async())
+                await asyncio.sleep(0)
+            self.finish()
+        finally:
+            self._io_handler.flush()
+
+    @property
+    def is_finished(self) -> bool:
+        return self._round >= self._rounds
+
+    def start(self) -> None:
+        if self._journal is not None and not self._journal.is_started:
+            self._journal.start(self)
+
+    def start_round(self) -> None:
+        self._round += 1
+        if isinstance(self._random, Batched_random):
+            self._random.new_round()
+        self.print_message(("events", "new_round"), self._round)
+        self._effects_scheduler.tick(self._round)
+        # stuns last one round, effects stun players again if they still work
+        for p in self._stunned:
+            p.set_stunned(False)
+        self._stunned.clear()
+        self._run_effects(Effect_reaction_time.BEFORE_ROUND)
+
+    def play_round(self, moves: dict) -> None:
+        """Applies moves of players in the current round. Casts of the same spell are grouped, and spells are put
+        into buckets by their priorities, so a round is resolved in linear time without sorting.
+
+        Args:
+            moves (dict): Moves which were got by get_moves.
+        """
+        casts: Dict[tuple, List[Tuple[str, Union[str, tuple]]]] = dict()
+        for caster_name, move in moves.items():
+            spell = move["spell"]
+            if spell in casts:
+                casts[spell].append((caster_name, move["target"]))
+            else:
+                casts[spell] = [(caster_name, move["target"])]
+        buckets: Dict[int, List[Spell_description]] = dict()
+        for spell in casts:
+            spell_descr = SPELLS[spell]
+            if spell_descr.priority in buckets:
+                buckets[spell_descr.priority].append(spell_descr)
+            else:
+                buckets[spell_descr.priority] = [spell_descr]
+        for priority in SPELL_PRIORITIES:
+            for spell_descr in buckets.get(priority, ()):
+                self._cast(spell_descr, casts[spell_descr.spell])
+        self._run_effects(Effect_reaction_time.AFTER_ROUND)
+        if self._journal is not None:
+            self._journal.record_round(self, moves)
+        if self._broadcaster is not None: # live standings for spectators
+            standings = "\n".join(f"{title}: {score}" for title, score in self.get_standings())
+            self._broadcaster.emit(("events", "standings"), (self._round, standings))
+        if self._event_log is not None:
+            self._event_log.flush()
+        self._io_handler.end_round()
+
+    def _cast(self, spell_descr: Spell_description, casts: List[Tuple[str, Union[str, tuple]]]) -> None:
+        """Applies all casts of one spell.
+
+        Args:
+            spell_descr (Spell_description): A spell.
+            casts (List[Tuple[str, Union[str, tuple]]]): Names of casters and names of their targets.
+        """
+        players = self._players
+        rng = self._random
+        reactions = EFFECTS_BY_REACTION_TIME[Effect_reaction_time.WITH_ACTION]
+        # players by names of targets, casts with the same targets share them
+        resolved: Dict[Union[str, tuple], List[Player]] = dict()
+        for caster_name, target in casts:
+            caster = players[caster_name]
+            if not caster.is_alive: # a caster died before its turn
+                continue
+            if target is None:
+                targets = ()
+            elif target in resolved:
+                targets = resolved[target]
+            else:
+                targets = resolved[target] = [players[name] for name in ((target, ) if isinstance(target, str) else target)]
+            targets = [t for t in targets if t.is_alive and (not reactions or self._react(t, spell_descr, reactions))]
+            if not targets:
+                self._print_cast(spell_descr, caster_name, target, False)
+                continue
+            if len(targets) == 1:
+                message_kwargs = spell_descr.func(targets[0], rng)
+            else:
+                message_kwargs = spell_descr.func(_make_group(targets), rng)
+            self._print_cast(spell_descr, caster_name, target, True, message_kwargs)
+
+    def _react(self, target: Player, spell_descr: Spell_description, reactions: Tuple[str]) -> bool:
+        """Runs effects of a target which work with actions.
+
+        Returns:
+            bool: False if an effect protects a target from a spell.
+        """
+        for title in reactions:
+            if target.has_active_effect(title) and not ALL_EFFECTS[title]["func"](target, self._random, spell_descr):
+                return False
+        return True
+
+    def _print_cast(self, spell_descr: Spell_description, caster_name: str, target: Union[str, tuple], is_succeeded: bool,
+                    message_kwargs: Optional[dict]=None) -> None:
+        if target == caster_name:
+            message_keys = ("spells", spell_descr.level, spell_descr.index, "self_message" if is_succeeded else "self_lose_message")
+        else:
+            message_keys = ("spells", spell_descr.level, spell_descr.index, "target_message" if is_succeeded else "target_lose_message")
+        # not all spells have messages
+        if self._catalog.get(message_keys) is not None:
+            target_name = target if target is None or isinstance(target, str) else ", ".join(target)
+            self.print_message(message_keys, player_name=caster_name, target_name=target_name, **(message_kwargs or {}))
+
+    def _run_effects(self, reaction_time: int) -> None:
+        """Runs functions of active effects with a reaction time.
+
+        Args:
+            reaction_time (int): BEFORE_ROUND or AFTER_ROUND.
+        """
+        for effect in self._effects_scheduler.get_active(reaction_time):
+            if effect.player.is_alive:
+                self._apply_effect(effect, effect.player)
+
+    def _apply_effect(self, effect, player: Player) -> None:
+        effect_descr = ALL_EFFECTS[effect.title]
+        message_kwargs = effect_descr["func"](player, self._random)
+        if player.is_stunned:
+            self._stunned.add(player)
+        if effect_descr["message"] is not None and message_kwargs is not None:
+            self.print_message(("effects", effect_descr["message"], "message"), player_name=player.name, **message_kwargs)
+
+    def finish(self) -> None:
+        """Prints results of the game.
+        """
         winners = self.get_winners()
         if len(winners) == 1:
             self.print_message(("events", "winner"), str(self.get_team(next(iter(winners)))))
         else:
             winners_str = '\n'.join((str(self.get_team(t)) for t in sorted(winners)))
             self.print_message(("events", "draw"), winners_str)
+        if self._event_log is not None:
+            self._event_log.flush()
+        self._io_handler.flush()
 
     def get_winners(self) -> set[Team]:
         """Select winners. If 1 team has more alive players, it win, else count by points
@@ -86,105 +322,339 @@ class Game:
             set[Team]: Set of winners.
         """
         winners = dict()
-        max_score = 0
-        for t in self._teams:
-            if t.get_score() > max_score:
-                winners.clear()
-                max_score = t.get_score()
-            if t.get_score() == max_score:
-                winners[t.title] = max_score
+        if not self._leaderboard:
+            return winners
+        max_score = self._leaderboard[-1][0]
+        if max_score < 0: # nobody wins with a negative score
+            return winners
+        for score, title in reversed(self._leaderboard):
+            if score != max_score:
+                break
+            winners[title] = score
         return winners
 
-    def get_team(self, title):
+    def fork(self, io_handler: IO_handler=None) -> "Game":
+        """Makes an independent copy of the game, e.g. to try moves by a bot. Teams, players and effects are copied,
+        everything what doesn't change while playing (messages, a logger, settings, cached tuples of names) is shared.
+        A fork doesn't write to a journal, a broadcaster and an event log of the game, and it has no savepoints.
+        A fork made between rounds plays in the same way as the game with the same moves.
+
+        Args:
+            io_handler (IO_handler, optional): A handler of a fork. Defaults to a Headless_IO_handler without providers,
+            so a fork prints nothing and its moves are passed to play_round.
+
+        Returns:
+            Game: A fork of the game.
+        """
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        if isinstance(self._random, Batched_random):
+            game._random = self._random.copy()
+        else:
+            game._random = random.Random.__new__(random.Random)
+            game._random.setstate(self._random.getstate())
+        game._io_handler = io_handler if io_handler is not None else Headless_IO_handler(dict())
+        game._io_handler.set_game(game)
+        game._journal = None
+        game._broadcaster = None
+        game._event_log = None
+        game._players = dict()
+        game._team_titles = dict()
+        game._targets = dict(self._targets)
+        game._leaderboard = list(self._leaderboard)
+        game._effects_scheduler = Effect_scheduler()
+        game._effects_scheduler.tick(self._round)
+        game._undo_log = Undo_log()
+        if self._states is not None:
+            from Objects.States import Array_state_view
+            game._states = self._states.copy()
+        game._teams = list()
         for t in self._teams:
-            if title == t.title:
-                return t
+            team = t.fork(game, game._effects_scheduler)
+            game._teams.append(team)
+            game._team_titles[team.title] = team
+            for name in team:
+                player = game._players[name] = team[name]
+                player.set_undo_log(game._undo_log)
+                if game._states is not None: # a copy of a player gets the same slot in copied arrays
+                    player.set_state(Array_state_view(game._states, self._players[name].state.slot))
+        game._stunned = {game._players[p.name] for p in self._stunned}
+        return game
+
+    def savepoint(self) -> int:
+        """Starts to record changes of the game, so they can be reverted by rollback, e.g. to try a round and revert it.
+        Savepoints can be nested. Only a state of the game is reverted, printed messages and records stay.
+
+        Returns:
+            int: A mark of a savepoint.
+        """
+        return self._undo_log.savepoint(chain((self, self._effects_scheduler), self._teams))
+
+    def rollback(self, mark: int=None) -> None:
+        """Reverts the game to a savepoint. The savepoint and all later ones are removed.
+
+        Args:
+            mark (int, optional): A mark of a savepoint. Defaults to the last savepoint.
+        """
+        self._undo_log.rollback(mark)
+
+    def release(self, mark: int=None) -> None:
+        """Keeps changes after a savepoint and removes the savepoint and all later ones.
+
+        Args:
+            mark (int, optional): A mark of a savepoint. Defaults to the last savepoint.
+        """
+        self._undo_log.release(mark)
+
+    def get_undo_state(self) -> tuple:
+        return (self._round, self._random.getstate(), list(self._leaderboard), set(self._stunned),
+                dict(self._targets), self._alive_players)
+
+    def set_undo_state(self, state: tuple) -> None:
+        random_state = state[1]
+        self._round, _, self._leaderboard, self._stunned, self._targets, self._alive_players = state
+        self._random.setstate(random_state)
+        if isinstance(self._random, Batched_random): # the rest of a block is lost, a new one is drawn
+            self._random.new_round()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def random(self) -> random.Random:
+        return self._random
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    @property
+    def rounds(self) -> int:
+        return self._rounds
+
+    def set_round(self, round_num: int) -> None:
+        """Sets the last started round, e.g. when a game is restored. The game continues from the next round.
+
+        Args:
+            round_num (int): A number of a round.
+        """
+        self._round = round_num
+        self._effects_scheduler.tick(round_num)
+
+    def track_stunned(self, player: Player) -> None:
+        """Makes a stunned player able to move again at the start of the next round, e.g. after a game is restored.
+
+        Args:
+            player (Player): A stunned player of the game.
+        """
+        self._stunned.add(player)
+
+    def get_teams(self) -> list:
+        return list(self._teams)
+
+    def get_team(self, title):
+        if title in self._team_titles:
+            return self._team_titles[title]
         raise ValueError(f"No such team: {title}")
 
     def search_player(self, player_name: str) -> Player:
-        for t in self._teams:
-            if player_name in t:
-                return t[player_name]
-        return None
+        return self._players.get(player_name)
+
+    def register_team(self, team: Team) -> None:
+        """Adds a team to the index of teams. Called by a team when it joins a game.
+
+        Args:
+            team (Team): A team of the game.
+
+        Raises:
+            ValueError: If there is another team with the same title.
+        """
+        if self._team_titles.get(team.title, team) is not team:
+            raise ValueError(f"A team {team.title} is already in the game")
+        if team.title not in self._team_titles:
+            insort(self._leaderboard, (team.get_score(), team.title))
+        self._team_titles[team.title] = team
+
+    def update_score(self, team: Team, old_score: int) -> None:
+        """Moves a team in the leaderboard. Called by a team when its score changes.
+
+        Args:
+            team (Team): A team of the game.
+            old_score (int): A previous score of a team.
+        """
+        i = bisect_left(self._leaderboard, (old_score, team.title))
+        del self._leaderboard[i]
+        insort(self._leaderboard, (team.get_score(), team.title))
+
+    def get_standings(self) -> List[Tuple[str, int]]:
+        """Returns titles and scores of teams from the best to the worst.
+        """
+        return [(title, score) for score, title in reversed(self._leaderboard)]
+
+    def register_player(self, player: Player) -> None:
+        """Adds a player to the index of players. Called by a team when a player joins it.
+
+        Args:
+            player (Player): A new player of the game.
+
+        Raises:
+            ValueError: If there is another player with the same name.
+        """
+        if self._players.get(player.name, player) is not player:
+            raise ValueError(f"A Player {player.name} is already in the game")
+        self._players[player.name] = player
+        self.invalidate_targets()
+        player.set_scheduler(self._effects_scheduler)
+        player.set_undo_log(self._undo_log)
+        if self._states is not None:
+            self._states.add(player)
 
     def get_all_players(self, only_alive: bool=False) -> list:
+        if only_alive:
+            return list(self.get_alive_players())
         all_players = list()
         for t in self._teams:
-            if only_alive: # TODO: optimize
-                all_players.extend(t.get_alive_members())
-            else:
-                all_players.extend(t.get_members())
+            all_players.extend(t.get_members())
         return all_players
+
+    def invalidate_targets(self) -> None:
+        """Drops cached targets. It's called when a player dies, revives or joins the game.
+        """
+        self._targets.clear()
+        self._alive_players = None
+
+    def get_alive_players(self) -> Tuple[str]:
+        """Returns names of all alive players. The tuple is cached until somebody dies, revives or joins.
+        """
+        if self._alive_players is None:
+            self._alive_players = tuple(chain.from_iterable(t.alive_names for t in self._teams))
+        return self._alive_players
+
+    def get_targets(self, team: Team) -> Tuple[Tuple[str], Tuple[str]]:
+        """Returns names of alive enemies and allies of a team. They are cached until somebody dies, revives or joins.
+
+        Args:
+            team (Team): A team of the game.
+
+        Returns:
+            Tuple[Tuple[str], Tuple[str]]: Names of alive enemies and names of alive members of a team.
+        """
+        targets = self._targets.get(team.title)
+        if targets is None:
+            enemies = tuple(chain.from_iterable(t.alive_names for t in self._teams if t is not team))
+            targets = self._targets[team.title] = (enemies, team.alive_names)
+        return targets
                 
     def get_moves(self) -> dict:
+        moves, players_can_move, pending = self._start_moves()
+        while len(moves) != len(players_can_move):
+            self._add_moves(self._io_handler.get_moves_batch(pending), moves, players_can_move, pending)
+        return moves
+
+    async def get_moves_async(self) -> dict:
+        moves, players_can_move, pending = self._start_moves()
+        while len(moves) != len(players_can_move):
+            self._add_moves(await self._io_handler.get_moves_batch_async(pending), moves, players_can_move, pending)
+        return moves
+
+    def _start_moves(self) -> Tuple[dict, Set[str], Dict[str, None]]:
         moves = dict()
+        # names of players whose moves are still awaited, they are asked in order of teams and members
+        pending = dict.fromkeys(chain.from_iterable(t.active_names for t in self._teams))
         # get names of players what can move
-        players_can_move = list()
-        for t in self._teams:
-            players_can_move.extend(t.get_active_members())
-        # get all moves
+        players_can_move = set(pending)
         self.print_message(("events", "ask_move"))
-        while len(moves) != len(players_can_move):
-            move = self._io_handler.get_move()
-            self._logger.debug(f"Input move: {move}")
-            if not move:
-                self.warning("empty_move")
-                continue
-            caster = next(iter(move)) # a move contains just one key
-            # check caster's name
-            if caster not in self.get_all_players():
-                self.warning("player_not_exists", caster)
-                continue
-            if caster not in players_can_move:
-                self.warning("wrong_caster", caster)
-                continue
-            # make a spell as a tuple (spell_lvl, spell_idx)
-            if move[caster]["spell"].isdigit():
-                spell_lvl, spell_idx = int(move[caster]["spell"][0]), int(move[caster]["spell"][1:])
-                move[caster]["spell"] = (spell_lvl, spell_idx)
+        return moves, players_can_move, pending
+
+    def _check_move(self, move: dict, players_can_move: Set[str]) -> Tuple[str, tuple]:
+        """Checks a move and converts its spell to a tuple and its target to a name or names of players.
+
+        Returns:
+            Tuple[str, tuple]: None if a move is correct, else a key of a warning and its arguments.
+        """
+        if not move:
+            return "empty_move", ()
+        caster = next(iter(move)) # a move contains just one key
+        caster_move = move[caster]
+        spell = caster_move["spell"]
+        self.log_event(Event_codes.INPUT_MOVE, caster, spell, caster_move["target"])
+        # check caster's name
+        if caster not in self._players:
+            return "player_not_exists", (caster, )
+        if caster not in players_can_move:
+            return "wrong_caster", (caster, )
+        # make a spell as a tuple (spell_lvl, spell_idx)
+        if isinstance(spell, str):
+            if spell.isdigit():
+                spell = (int(spell[0]), int(spell[1:]))
             else:
-                spell = self._messages["aliases"].get(move[caster]["spell"])
-                move[caster]["spell"] = spell
-            # check if a spell exists
-            if move[caster]["spell"] not in get_all_spells():
-                self.warning("spell_not_exists", move[caster]["spell"])
+                spell = self._aliases.get(spell)
+            caster_move["spell"] = spell
+        # check if a spell exists
+        if spell not in SPELLS_KEYS:
+            return "spell_not_exists", (spell, )
+        # target handling
+        if caster_move.get("target"):
+            # check if a spell can be used as a target
+            if not self.check_target(caster, spell, caster_move["target"]):
+                return "bad_target", (caster_move["target"], spell)
+        else:
+            # autotarget if it is possible
+            targets = self.autotarget(caster, spell)
+            if len(targets) > 1:
+                if SPELLS[spell].is_directed:
+                    return "target_must_exist", (spell, )
+                caster_move["target"] = targets
+            elif len(targets) == 1:
+                caster_move["target"] = targets[0]
+        return None
+
+    def _add_move(self, move: dict, moves: dict, players_can_move: Set[str], pending: Dict[str, None]) -> None:
+        """Checks a move and saves it to moves if it's correct.
+        """
+        warning = self._check_move(move, players_can_move)
+        if warning is not None:
+            self.warning(warning[0], *warning[1])
+            return
+        caster = next(iter(move))
+        if caster in moves:
+            self.print_message(("events", "move_updated"), caster, move[caster]["spell"], move[caster]["target"])
+        else:
+            self.print_message(("events", "move_saved"), caster, move[caster]["spell"], move[caster]["target"])
+        moves.update(move)
+        pending.pop(caster, None)
+
+    def _add_moves(self, batch: List[dict], moves: dict, players_can_move: Set[str], pending: Dict[str, None]) -> None:
+        """Checks moves of a batch in one pass. Instead of a message for every move, one report is printed.
+        """
+        if len(batch) <= 1:
+            self._add_move(batch[0] if batch else None, moves, players_can_move, pending)
+            return
+        accepted = 0
+        check_move, warning = self._check_move, self.warning
+        for move in batch:
+            rejection = check_move(move, players_can_move)
+            if rejection is not None:
+                warning(rejection[0], *rejection[1])
                 continue
-            # target handling
-            if move[caster].get("target"):
-                # check if a spell can be used as a target
-                if not self.check_target(caster, move[caster]["spell"], move[caster]["target"]):
-                    self.warning("bad_target", move[caster]["target"], move[caster]["spell"])
-                    continue
-            else:
-                # autotarget if it is possible
-                targets = self.autotarget(caster, move[caster]["spell"])
-                spell_descr = get_spell_description(*move[caster]["spell"])
-                if len(targets) > 1:
-                    if Spell_targets.DIRECTED in spell_descr["target_type"]:
-                        self.warning("target_must_exist", move[caster]["spell"])
-                        continue
-                    else:
-                        move[caster]["target"] = targets
-                elif len(targets) == 1:
-                    move[caster]["target"] = targets[0]
-            if caster in moves:
-                self.print_message(("events", "move_updated"), caster, move[caster]["spell"], move[caster]["target"])
-            else:
-                self.print_message(("events", "move_saved"), caster, move[caster]["spell"], move[caster]["target"])
             moves.update(move)
-        return moves
+            for caster in move:
+                pending.pop(caster, None)
+            accepted += 1
+        self.print_message(("events", "moves_report"), accepted, len(batch) - accepted)
 
     def check_target(self, caster_name, spell, target_name):
-        spell_descr = get_spell_description(spell)
+        spell_descr = SPELLS.get(spell)
         caster_player = self.search_player(caster_name)
         target_player = self.search_player(target_name)
         if not caster_player or not spell_descr or not target_player:
             return False
-        if spell_descr["target_type"] == Spell_targets.SELF and caster_player != target_player:
+        if spell_descr.kind == Spell_targets.SELF and caster_player != target_player:
             return False
-        if spell_descr["target_type"] == (Spell_targets.DIRECTED, Spell_targets.ENEMY) and caster_player.team != target_player.team:
+        if spell_descr.side == Spell_targets.ENEMY and caster_player.team == target_player.team:
             return False
-        if spell_descr["target_type"] == (Spell_targets.DIRECTED, Spell_targets.ALLY) and caster_player.team == target_player.team:
+        if spell_descr.side == Spell_targets.ALLY and caster_player.team != target_player.team:
             return False
         return True
     
@@ -195,23 +665,21 @@ class Game:
             caster_name (Player): A caster of a spell.
             spell (tuple): A tuple of form (spell_level, spell_index).
         """
-        spell_descr = get_spell_description(*spell)
+        spell_descr = SPELLS.get(spell)
         caster_player = self.search_player(caster_name)
         if not spell_descr:
             self.warning("spell_not_exists", spell)
-        if spell_descr["target_type"] == Spell_targets.SELF:
+            return None
+        if spell_descr.kind == Spell_targets.SELF:
             return (caster_player.name, )
-        elif spell_descr["target_type"] == Spell_targets.ALL:
-            return self.get_all_players(True)
-        if Spell_targets.ENEMY in spell_descr["target_type"]:
-            # get all enemies
-            enemies = list()
-            for t in self._teams:
-                if t != caster_player.team:
-                    enemies.extend(t.get_members())
-            return tuple(enemies)
-        elif Spell_targets.ALLY in spell_descr["target_type"]:
-            return tuple(caster_player.team.get_members())
+        elif spell_descr.kind == Spell_targets.ALL:
+            return self.get_alive_players()
+        if spell_descr.side == Spell_targets.ENEMY:
+            return self.get_targets(caster_player.team)[0]
+        elif spell_descr.side == Spell_targets.ALLY:
+            return self.get_targets(caster_player.team)[1]
+        elif spell_descr.is_directed:
+            return self.get_alive_players()
         else:
             self.warning("spell_not_exists", spell)
             return None
@@ -219,57 +687,97 @@ class Game:
     def input(self, *args, **kwargs) -> None:
         self._io_handler.input(*args, **kwargs)
 
+    def log_event(self, code: int, *args) -> None:
+        """Records an event (see Objects.Event_log) and writes it to the debug log.
+        Events are formatted only if somebody reads them.
+
+        Args:
+            code (int): A code of an event from Event_codes.
+        """
+        if self._event_log is not None:
+            self._event_log.record(self._round, code, args)
+        if self._debug:
+            self._logger.debug("%s: %s", EVENT_NAMES[code], args)
+
     def find_message(self, message_keys: Iterable) -> str:
-        message_dict = self._messages
-        for k in message_keys:
-            if k in message_dict:
-                message_dict = message_dict[k]
-            else:
-                self._logger.error(f"There is no {k} in {message_dict.keys()}")
-                break
-        return message_dict
+        template = self._catalog.get(tuple(message_keys))
+        if template is None:
+            self._no_message(tuple(message_keys))
+            return None
+        return template.text
+
+    def _no_message(self, message_keys: tuple) -> None:
+        if self._event_log is not None:
+            self._event_log.record(self._round, Event_codes.NO_MESSAGE, (message_keys, ))
+        self._logger.error("There is no message %s", message_keys)
+
+    def _render(self, message_keys: Iterable, format_args: tuple, format_kwargs: dict) -> str:
+        if type(message_keys) is not tuple:
+            message_keys = tuple(message_keys)
+        template = self._catalog.get(message_keys)
+        if template is None:
+            self._no_message(message_keys)
+            return None
+        return template.render(format_args, format_kwargs)
 
     def print(self, *args, **kwargs):
         self._io_handler.print(*args, **kwargs)
     
     def print_message(self, message_keys: Iterable, *format_args, **format_kwargs) -> None:
-        message = self.find_message(message_keys)
-        self._io_handler.print(f"{message.format(*format_args, **format_kwargs)}{self._message_splitter}")
+        if self._event_log is not None:
+            self._event_log.record(self._round, Event_codes.MESSAGE, (tuple(message_keys), format_args, format_kwargs))
+        message = self._render(message_keys, format_args, format_kwargs)
+        if message is not None:
+            self._io_handler.print(message + self._message_splitter)
+        if self._broadcaster is not None:
+            self._broadcaster.emit(tuple(message_keys), format_args, format_kwargs)
 
-    def warning(self, message_key: Iterable, *format_args, **format_kwargs) -> None:
-        message = self.find_message(("warnings", message_key))
-        self._logger.warning(message.format(*format_args, **format_kwargs))
+    def warning(self, message_key: str, *format_args, **format_kwargs) -> None:
+        if self._event_log is not None:
+            self._event_log.record(self._round, Event_codes.WARNING, (("warnings", message_key), format_args, format_kwargs))
+        # a message is rendered only if it's logged
+        if self._logger.isEnabledFor(logging.WARNING):
+            message = self._render(("warnings", message_key), format_args, format_kwargs)
+            if message is not None:
+                self._logger.warning(message)
 
     def error(self, message_keys: Iterable, *format_args, **format_kwargs) -> None:
-        message = self.find_message(message_keys)
-        self._logger.error(message.format(*format_args, **format_kwargs))
+        if self._event_log is not None:
+            self._event_log.record(self._round, Event_codes.ERROR, (tuple(message_keys), format_args, format_kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            message = self._render(message_keys, format_args, format_kwargs)
+            if message is not None:
+                self._logger.error(message)
 
     @staticmethod
-    def make_teams_from_dict(teams_dict: Dict[str, Iterable[str]], **player_kwargs) -> Set[Team]:
-        """Makes set of teams from dict.
+    def make_teams_from_dict(teams_dict: Dict[str, Iterable[str]], **player_kwargs) -> List[Team]:
+        """Makes list of teams from dict. Teams and players keep the order of the dict.
 
         Args:
             teams_dict (Dict[str, Dict]): dict with its title and Iterable with players names.
 
         Returns:
-            Set[Team]: Set with Team objects.
+            List[Team]: List with Team objects.
         """
-        return {Team(t_title, *{Player(p_name, **player_kwargs) for p_name in teams_dict[t_title]}) for t_title in teams_dict}
+        return [Team(t_title, *[Player(p_name, **player_kwargs) for p_name in dict.fromkeys(teams_dict[t_title])])
+                for t_title in teams_dict]
 
     @staticmethod
-    def make_teams(teams_num: int=0, team_size: int=0, io_handler: IO_handler=Std_IO_handler(), **p_kwargs) -> Set[Team]:
+    def make_teams(teams_num: int=0, team_size: int=0, io_handler: IO_handler=None, **p_kwargs) -> List[Team]:
         # TODO: write docstring
         """[summary]
 
         Args:
             teams_num (int, optional): [description]. Defaults to 0.
             team_size (int, optional): [description]. Defaults to 0.
-            io_handler (IO_handler, optional): [description]. Defaults to Std_IO_handler().
+            io_handler (IO_handler, optional): [description]. Defaults to a new Std_IO_handler.
 
         Returns:
-            Set[Team]: [description]
+            List[Team]: [description]
         """
-        teams: Set[Team] = set()
+        if io_handler is None:
+            io_handler = Std_IO_handler()
+        teams: List[Team] = list()
         while not teams_num:
             io_handler.print("Input a number of teams: ")
             teams_num_str: str = io_handler.input()
@@ -287,4 +795,5 @@ class Game:
             for _ in range(team_size):
                 io_handler.print("Input a name of a player: ")
                 team.add(Player(io_handler.input(), **p_kwargs))
+            teams.append(team)
         return teams
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""Host which runs many games concurrently in one event loop.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Set
+
+from Objects.Game import Game
+
+_logger = logging.getLogger("Astral")
+
+
+class Game_host:
+    def __init__(self, max_games: int=1000, max_waiting: int=10000) -> None:
+        """Games are run as tasks of one event loop. Every game gives way to other games after each round,
+        so games with ready moves take turns round by round. Not more than max_games games run at once,
+        others wait for a free place in order of their submission.
+
+        Args:
+            max_games (int, optional): A number of games which can run at once. Defaults to 1000.
+            max_waiting (int, optional): A number of games which can wait for a start. Defaults to 10000.
+        """
+        self._max_games = max_games
+        self._max_waiting = max_waiting
+        self._places = asyncio.Semaphore(max_games)
+        self._tasks: Set[asyncio.Task] = set()
+        self._waiting = 0
+        self._running = 0
+        self._finished = 0
+        self._failed = 0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns numbers of waiting, running, finished and failed games.
+        """
+        return {
+            "waiting": self._waiting,
+            "running": self._running,
+            "finished": self._finished,
+            "failed": self._failed,
+        }
+
+    def submit(self, game: Game) -> asyncio.Task:
+        """Adds a game to the host. It must be called in a running event loop.
+
+        Args:
+            game (Game): A game with a non-blocking IO handler, e.g. Async_IO_handler or Headless_IO_handler.
+            The base IO_handler.get_move_async waits for input in the event loop, so a blocking handler
+            (e.g. Std_IO_handler) stalls all games of the host.
+
+        Raises:
+            RuntimeError: If too many games are waiting for a start.
+
+        Returns:
+            asyncio.Task: A task which returns winners of a game.
+        """
+        if self._waiting >= self._max_waiting:
+            raise RuntimeError(f"Too many games are waiting: {self._waiting}")
+        self._waiting += 1
+        task = asyncio.get_running_loop().create_task(self._run_game(game), name=game.name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run_game(self, game: Game) -> dict:
+        try:
+            await self._places.acquire()
+        finally:
+            self._waiting -= 1
+        self._running += 1
+        try:
+            await game.run_async()
+            self._finished += 1
+            return game.get_winners()
+        except Exception:
+            self._failed += 1
+            _logger.exception("%s failed", game.name)
+            raise
+        finally:
+            self._running -= 1
+            self._places.release()
+
+    async def join(self) -> None:
+        """Waits until all submitted games end.
+        """
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -1,12 +1,23 @@
 # -*- coding: utf-8 -*-
 
-from typing import IO
+from collections import deque
+from typing import IO, Callable, Dict, Iterable, List, Union
 from sys import stdin, stdout
 
 class IO_handler:
     def __init__(self, in_stream: IO, out_stream: IO) -> None:
         self._i_stream = in_stream
         self._o_stream = out_stream
+        self._game = None
+        self._batches = deque()
+
+    def set_game(self, game) -> None:
+        """Binds a handler to a game which uses it.
+
+        Args:
+            game (Game): A game which reads moves from the handler.
+        """
+        self._game = game
 
     def input(self, *args, **kwargs) -> str:
         raise NotImplementedError
@@ -14,13 +25,100 @@ class IO_handler:
     def print(self, *args, **kwargs) -> None:
         raise NotImplementedError
 
-    def get_move(self) -> dict:
+    def flush(self) -> None:
+        """Writes buffered output. Handlers without a buffer do nothing.
+        """
+        pass
+
+    def end_round(self) -> None:
+        """It's called by a game at the end of every round.
+        """
+        self.flush()
+
+    def get_move(self, pending: Iterable[str]=()) -> dict:
         """Returns 3 components of a move: caster, spell and target.
 
+        Args:
+            pending (Iterable[str], optional): Names of players whose moves are still awaited. Defaults to ().
+
+        Returns:
+            dict: A dict of form {caster: {"spell": spell, "target": target}} or None if a move is wrong.
+        """
+        return self.parse_move(self.input())
+
+    async def get_move_async(self, pending: Iterable[str]=()) -> dict:
+        """Returns a move in an event loop. By default it's the same as get_move.
+
+        Args:
+            pending (Iterable[str], optional): Names of players whose moves are still awaited. Defaults to ().
+
+        Returns:
+            dict: A dict of form {caster: {"spell": spell, "target": target}} or None if a move is wrong.
+        """
+        return self.get_move(pending)
+
+    def submit_moves(self, batch: Union[str, Iterable[tuple]]) -> None:
+        """Adds moves of many players at once, e.g. all moves of a bot for a round.
+        They are returned by the next call of get_moves_batch.
+
+        Args:
+            batch (Union[str, Iterable[tuple]]): Lines of form "caster spell [target]" or tuples (caster, spell[, target]).
+        """
+        self._batches.append(self.parse_moves(batch))
+
+    def get_moves_batch(self, pending: Iterable[str]=()) -> List[dict]:
+        """Returns moves which are ready. By default it's a submitted batch or one move from get_move.
+
+        Args:
+            pending (Iterable[str], optional): Names of players whose moves are still awaited. Defaults to ().
+
+        Returns:
+            List[dict]: Moves of form {caster: {"spell": spell, "target": target}}, wrong moves are None.
+        """
+        if self._batches:
+            return self._batches.popleft()
+        return [self.get_move(pending)]
+
+    async def get_moves_batch_async(self, pending: Iterable[str]=()) -> List[dict]:
+        """Returns moves which are ready in an event loop. By default it's the same as get_moves_batch,
+        but a single move is got by get_move_async.
+        """
+        if self._batches:
+            return self._batches.popleft()
+        return [await self.get_move_async(pending)]
+
+    @staticmethod
+    def parse_moves(batch: Union[str, Iterable[tuple]]) -> List[dict]:
+        """Parses many moves.
+
+        Args:
+            batch (Union[str, Iterable[tuple]]): Lines of form "caster spell [target]" or tuples (caster, spell[, target]).
+            A spell in a tuple can be a tuple (spell_level, spell_index).
+
+        Returns:
+            List[dict]: Moves of form {caster: {"spell": spell, "target": target}}, wrong moves are None.
+        """
+        if isinstance(batch, str):
+            return [IO_handler.parse_move(line) for line in batch.splitlines() if line]
+        moves = list()
+        for move in batch:
+            if 2 <= len(move) <= 3:
+                moves.append({move[0]: {"spell": move[1], "target": move[2] if len(move) == 3 else None}})
+            else:
+                moves.append(None)
+        return moves
+
+    @staticmethod
+    def parse_move(line: str) -> dict:
+        """Parses a move of form "caster spell [target]".
+
+        Args:
+            line (str): A line with a move.
+
         Returns:
-            [type]: [description]
+            dict: A dict of form {caster: {"spell": spell, "target": target}} or None if a move is wrong.
         """
-        splitted_move = self.input().split(' ')
+        splitted_move = line.split(' ')
         if len(splitted_move) != 2 and len(splitted_move) != 3:
             return None
         return {
@@ -31,12 +129,112 @@ class IO_handler:
         }
 
 class Std_IO_handler(IO_handler):
-    def __init__(self) -> None:
-        super().__init__(stdin, stdout)
+    def __init__(self, buffered: bool=False, buffer_size: int=65536, in_stream: IO=stdin, out_stream: IO=stdout) -> None:
+        """IO handler for text streams. In buffered mode messages are encoded and collected in a buffer,
+        which is written by one call at the end of a round, before reading an input or when it exceeds buffer_size.
+
+        Args:
+            buffered (bool, optional): Collect messages instead of flushing every one. Defaults to False.
+            buffer_size (int, optional): A size of the buffer in bytes which causes writing. Defaults to 65536.
+            in_stream (IO, optional): An input stream. Defaults to stdin.
+            out_stream (IO, optional): An output stream. Defaults to stdout.
+        """
+        super().__init__(in_stream, out_stream)
+        self._buffered = buffered
+        self._buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._encoding = getattr(out_stream, "encoding", None) or "utf-8"
+        self._errors = getattr(out_stream, "errors", None) or "strict"
 
     def input(self, *args, **kwargs) -> str:
+        self.flush() # a player must see all messages before a move
         return self._i_stream.readline(*args, **kwargs).rstrip()
 
+    def print(self, message: str) -> None:
+        if not self._buffered:
+            self._o_stream.write(message)
+            self._o_stream.flush()
+            return
+        self._buffer += message.encode(self._encoding, self._errors)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        binary_stream = getattr(self._o_stream, "buffer", None)
+        if binary_stream is not None:
+            self._o_stream.flush() # keep order with text written directly
+            binary_stream.write(self._buffer)
+            binary_stream.flush()
+        else:
+            self._o_stream.write(self._buffer.decode(self._encoding, self._errors))
+            self._o_stream.flush()
+        self._buffer.clear()
+
+class Headless_IO_handler(IO_handler):
+    def __init__(self, providers: Union[Callable, Dict[str, Callable]], max_requests: int=100) -> None:
+        """IO handler without streams: moves are taken from move providers instead of an input.
+        A move provider is a callable which gets a game and a name of a player and returns a tuple (spell, target),
+        where spell is a tuple (spell_level, spell_index) or an alias and target is a name of a player or None.
+
+        Args:
+            providers (Union[Callable, Dict[str, Callable]]): One provider for all players or a dict with providers for every player.
+            max_requests (int, optional): How many times providers are asked for moves before the handler gives up. Defaults to 100.
+        """
+        super().__init__(None, None)
+        self._providers = providers
+        self._max_requests = max_requests
+        self._requests = 0
+        self._pending = None
+        self._pending_num = 0
+        self._moves = deque()
+
+    def input(self, *args, **kwargs) -> str:
+        return ""
+
     def print(self, *args, **kwargs) -> None:
-        self._o_stream.write(*args, **kwargs)
-        self._o_stream.flush()
+        pass
+
+    def get_provider(self, player_name: str) -> Callable:
+        if isinstance(self._providers, dict):
+            return self._providers[player_name]
+        return self._providers
+
+    def _ask_providers(self, pending: Iterable[str]) -> None:
+        # providers are asked again only if previous moves were rejected,
+        # it's limited only when no moves were accepted since the last request
+        if pending is not self._pending or len(pending) != self._pending_num:
+            self._pending = pending
+            self._pending_num = len(pending)
+            self._requests = 0
+        self._requests += 1
+        if self._requests > self._max_requests:
+            raise RuntimeError(f"Move providers didn't give correct moves for {sorted(pending)}")
+        for player_name in pending:
+            # spells are given as tuples, a game accepts them without parsing
+            spell, target = self.get_provider(player_name)(self._game, player_name)
+            self._moves.append({player_name: {"spell": spell, "target": target}})
+
+    def get_moves_batch(self, pending: Iterable[str]=()) -> List[dict]:
+        if self._batches:
+            return self._batches.popleft()
+        if not self._moves:
+            self._ask_providers(pending)
+            if not self._moves:
+                return [None]
+        moves = list(self._moves)
+        self._moves.clear()
+        return moves
+
+    async def get_moves_batch_async(self, pending: Iterable[str]=()) -> List[dict]:
+        """Providers are synchronous, so moves are got by get_moves_batch.
+        """
+        return self.get_moves_batch(pending)
+
+    def get_move(self, pending: Iterable[str]=()) -> dict:
+        if not self._moves:
+            self._ask_providers(pending)
+            if not self._moves:
+                return None
+        return self._moves.popleft()
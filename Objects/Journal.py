@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+"""Append-only journal of a game for replays and audit.
+A journal is a header and a sequence of records. Every record has a type, a number of a round and a length of a payload:
+    keyframe - a snapshot of a whole game (see Objects.Snapshot) at the end of a round
+    moves - validated moves of a round as utf-8 JSON
+    delta - players whose records changed in a round or who have effects (a name and Player.dump_bytes) and a state of a random generator;
+            players with effects are always written, because timers of effects are counted from a round
+A replay seeks to a round by restoring the nearest keyframe and applying deltas after it.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+from struct import Struct
+from typing import IO, TYPE_CHECKING, Dict, List, Tuple
+
+from Objects.Snapshot import Game_snapshot, LENGTH_STRUCT, dump_game, pack_random_state, unpack_random_state
+
+if TYPE_CHECKING:
+    from Objects.Game import Game
+
+MAGIC = b"ASTJ"
+VERSION = 1
+HEADER_STRUCT = Struct("<4sH")
+RECORD_STRUCT = Struct("<BII")
+COUNT_STRUCT = Struct("<I")
+
+
+class Journal_records:
+    KEYFRAME = 0
+    MOVES = 1
+    DELTA = 2
+
+
+class Journal_writer:
+    def __init__(self, file: str, keyframe_interval: int=50) -> None:
+        """Writes a journal while a game is running. Every record is written and flushed at once,
+        only the last saved states of players are kept in memory.
+
+        Args:
+            file (str): A path of a journal file.
+            keyframe_interval (int, optional): How many rounds are between keyframes. Defaults to 50.
+        """
+        self._file: IO = open(file, "wb")
+        self._file.write(HEADER_STRUCT.pack(MAGIC, VERSION))
+        self._keyframe_interval = keyframe_interval
+        self._players: Dict[str, bytes] = None
+
+    def __enter__(self) -> Journal_writer:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def is_started(self) -> bool:
+        return self._players is not None
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _write(self, record_type: int, round_num: int, payload: bytes) -> None:
+        self._file.write(RECORD_STRUCT.pack(record_type, round_num, len(payload)))
+        self._file.write(payload)
+
+    def _dump_players(self, game: Game) -> Dict[str, bytes]:
+        return {name: game.search_player(name).dump_bytes() for name in game.get_all_players()}
+
+    def start(self, game: Game) -> None:
+        """Writes the first keyframe of a game.
+
+        Args:
+            game (Game): A game.
+        """
+        self._write(Journal_records.KEYFRAME, game.round, dump_game(game))
+        self._players = self._dump_players(game)
+        self._file.flush()
+
+    def record_round(self, game: Game, moves: dict) -> None:
+        """Writes moves of a round and changes of a game after them.
+
+        Args:
+            game (Game): A game at the end of a round.
+            moves (dict): Moves which were got by Game.get_moves.
+        """
+        round_num = game.round
+        self._write(Journal_records.MOVES, round_num, json.dumps(moves, ensure_ascii=False).encode("utf-8"))
+        players = self._dump_players(game)
+        if round_num % self._keyframe_interval == 0:
+            self._write(Journal_records.KEYFRAME, round_num, dump_game(game))
+        else:
+            changed = [LENGTH_STRUCT.pack(len(name_bytes)) + name_bytes + data
+                       for name, data in players.items()
+                       if self._players.get(name) != data or game.search_player(name).get_effects()
+                       for name_bytes in (name.encode("utf-8"), )]
+            self._write(Journal_records.DELTA, round_num,
+                        b"".join((COUNT_STRUCT.pack(len(changed)), *changed, pack_random_state(game.random.getstate()))))
+        self._players = players
+        self._file.flush()
+
+
+class Replay:
+    def __init__(self, file: str) -> None:
+        """Reads a journal. A file is memory-mapped and only headers of records are read while opening.
+
+        Args:
+            file (str): A path of a journal file.
+
+        Raises:
+            ValueError: If a file is not a journal or its version is not supported.
+        """
+        self._file = open(file, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = HEADER_STRUCT.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError("It is not a journal of a game")
+        if version != VERSION:
+            raise ValueError(f"Unsupported version of a journal: {version}")
+        # offsets and lengths of payloads by types of records and rounds
+        self._records: Tuple[Dict[int, Tuple[int, int]]] = (dict(), dict(), dict())
+        self._keyframes: List[int] = list()
+        offset = HEADER_STRUCT.size
+        size = len(self._data)
+        while offset + RECORD_STRUCT.size <= size:
+            record_type, round_num, length = RECORD_STRUCT.unpack_from(self._data, offset)
+            offset += RECORD_STRUCT.size
+            if offset + length > size: # a record was not written completely
+                break
+            self._records[record_type][round_num] = (offset, length)
+            if record_type == Journal_records.KEYFRAME:
+                self._keyframes.append(round_num)
+            offset += length
+
+    def __enter__(self) -> Replay:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    @property
+    def last_round(self) -> int:
+        return max(max(self._records[Journal_records.KEYFRAME], default=0),
+                   max(self._records[Journal_records.DELTA], default=0))
+
+    def _payload(self, record_type: int, round_num: int) -> memoryview:
+        offset, length = self._records[record_type][round_num]
+        return memoryview(self._data)[offset:offset + length]
+
+    def get_moves(self, round_num: int) -> dict:
+        """Returns moves of a round.
+
+        Args:
+            round_num (int): A number of a round.
+
+        Returns:
+            dict: Moves in the same form as Game.get_moves returns, but spells are lists.
+        """
+        if round_num not in self._records[Journal_records.MOVES]:
+            raise ValueError(f"No moves of round {round_num} in a journal")
+        return json.loads(bytes(self._payload(Journal_records.MOVES, round_num)))
+
+    def seek(self, round_num: int, **game_kwargs) -> Game:
+        """Restores a game at the end of a round.
+
+        Args:
+            round_num (int): A number of a round.
+
+        Raises:
+            ValueError: If a round is not in a journal.
+
+        Returns:
+            Game: A game at the end of a round.
+        """
+        keyframe = max((r for r in self._keyframes if r <= round_num), default=None)
+        if keyframe is None or round_num > self.last_round:
+            raise ValueError(f"No round {round_num} in a journal")
+        game = Game_snapshot(self._payload(Journal_records.KEYFRAME, keyframe)).restore(**game_kwargs)
+        for r in range(keyframe + 1, round_num + 1):
+            self._apply_delta(game, r)
+        return game
+
+    def _apply_delta(self, game: Game, round_num: int) -> None:
+        data = self._payload(Journal_records.DELTA, round_num)
+        game.set_round(round_num)
+        changed_num, = COUNT_STRUCT.unpack_from(data, 0)
+        offset = COUNT_STRUCT.size
+        for _ in range(changed_num):
+            length, = LENGTH_STRUCT.unpack_from(data, offset)
+            offset += LENGTH_STRUCT.size
+            name = str(data[offset:offset + length], "utf-8")
+            player = game.search_player(name)
+            offset = player.load_bytes(data, offset + length)
+            if player.is_stunned:
+                game.track_stunned(player)
+        game.random.setstate(unpack_random_state(data, offset))
@@ -1,10 +1,32 @@
 # -*- coding: utf-8 -*-
 
-from collections import OrderedDict
-from typing import Iterable, Union
+from struct import Struct
+from typing import Dict, Iterable, List, Union
 
-from Objects.Effects import ALL_EFFECTS
-from Objects.Spells import ALL_SPELLS, get_all_spells
+from Objects.Effects import ALL_EFFECTS, Effect, Effect_scheduler
+from Objects.Spells import SPELLS, SPELLS_KEYS
+from Objects.Undo import Undo_log
+
+
+# binary format of a player: stats, a stun flag, numbers of effects and spells,
+# then effects (an index of a title in ALL_EFFECTS, a timer, a duration, a lock flag) and spells (a level, an index, a count)
+PLAYER_STRUCT = Struct("<iiii?HH")
+EFFECT_STRUCT = Struct("<Bii?")
+SPELL_STRUCT = Struct("<BBh")
+EFFECTS_TITLES = tuple(ALL_EFFECTS)
+EFFECTS_INDEXES = {title: i for i, title in enumerate(EFFECTS_TITLES)}
+
+
+class Player_state:
+    """Stats of a player stored as plain attributes.
+    """
+    __slots__ = ("max_health_points", "health_points", "mana_points", "armor")
+
+    def __init__(self, max_health_points: int, health_points: int, mana_points: int, armor: int) -> None:
+        self.max_health_points = max_health_points
+        self.health_points = health_points
+        self.mana_points = mana_points
+        self.armor = armor
 
 
 class Player:
@@ -31,10 +53,13 @@ class Player:
         if not isinstance(name, str):
             raise ValueError(f"Player's name must be a string, not {type(name)}")
         self._name = name
-        self._max_health_points = max_health_points
-        self._health_points = health_points if health_points > 0 else max_health_points
-        self._mana_points = mana_points if mana_points > 0 else max_health_points
-        self._armor = armor
+        # stats are kept in a separate object, so they can be moved to a shared storage (see Objects.States)
+        self._state = Player_state(max_health_points,
+                                   health_points if health_points > 0 else max_health_points,
+                                   mana_points if mana_points > 0 else max_health_points,
+                                   armor)
+        # the last known state of life, a team is notified when it changes
+        self._is_alive = self._state.health_points > 0
         self._is_stunned = False
         self._team = team
         # spells of each player saves in the dict, where a key is a index of a spell and a value is its count
@@ -52,17 +77,118 @@ class Player:
                 raise ValueError(f"Wrong data used for player's spells initiate")
         else:
             self._spells = dict()
-        # contain effects in a list as dicts with titles of effects as keys, values are dicts with:
-        # timer: when an effect will be executed. If it < 0, it await, else it runs until timer < a duration of an effect
-        # duration: how much an effect will work
-        # is_locked: shows is an effect is cleanable. Not the same as is_clearable in an effect description 
-        self._effects = list()
+        # a number of spells which can be used in stun, and the last known ability to move
+        self._stun_spells = self._count_stun_spells()
+        self._can_move = self.can_move()
+        # effects are stored in order of their creation as Effect objects by their numbers,
+        # and also are indexed by titles for fast search and removal
+        self._effects: Dict[int, Effect] = dict()
+        self._effects_by_title: Dict[str, Dict[int, Effect]] = dict()
+        # a game-wide scheduler which counts rounds and removes expired effects
+        self._scheduler: Effect_scheduler = None
+        # an undo log of a game, a player saves its state there before changes (see Objects.Undo)
+        self._undo_log: Undo_log = None
 
     def __repr__(self) -> str:
         return f"<Player {self._name}>"
 
     def __str__(self) -> str:
-        return f"{self._name}: {self._health_points} hp, {self._mana_points} mp"
+        return f"{self._name}: {self._state.health_points} hp, {self._state.mana_points} mp"
+
+    def _publish(self, old_score: int) -> None:
+        """Notifies a team about a change of a score and of a state of life.
+
+        Args:
+            old_score (int): A score before a change.
+        """
+        if self._team is not None:
+            score = self.score
+            if score != old_score:
+                self._team.add_score(score - old_score)
+        self.check_alive()
+
+    def check_alive(self) -> None:
+        """Notifies a team if a player died or revived. It must be called after every change of health points,
+        including changes made directly in a storage of stats.
+        """
+        is_alive = self._state.health_points > 0
+        if is_alive != self._is_alive:
+            self._is_alive = is_alive
+            if self._team is not None:
+                self._team.update_alive(self)
+        self.check_active()
+
+    def check_active(self) -> None:
+        """Notifies a team if a player got or lost an ability to move.
+        """
+        can_move = self.can_move()
+        if can_move != self._can_move:
+            self._can_move = can_move
+            if self._team is not None:
+                self._team.update_active(self)
+
+    def record_undo(self) -> None:
+        """Saves a state of a player to an undo log of a game before a change.
+        Changes which are made directly in a storage of stats must call it first.
+        """
+        if self._undo_log is not None:
+            self._undo_log.save(self)
+
+    def set_undo_log(self, undo_log: Undo_log) -> None:
+        self._undo_log = undo_log
+
+    def get_undo_state(self) -> tuple:
+        state = self._state
+        return (state.max_health_points, state.health_points, state.mana_points, state.armor, self._is_alive,
+                self._is_stunned, self._can_move, dict(self._spells), self._stun_spells, tuple(self._effects.values()))
+
+    def set_undo_state(self, saved: tuple) -> None:
+        state = self._state
+        (state.max_health_points, state.health_points, state.mana_points, state.armor, self._is_alive,
+         self._is_stunned, self._can_move, self._spells, self._stun_spells, effects) = saved
+        self._effects = dict()
+        self._effects_by_title = dict()
+        for e in effects:
+            e.player = self
+            self._effects[e.number] = e
+            if e.title in self._effects_by_title:
+                self._effects_by_title[e.title][e.number] = e
+            else:
+                self._effects_by_title[e.title] = {e.number: e}
+
+    def fork(self, team, scheduler: Effect_scheduler) -> "Player":
+        """Makes an independent copy of a player for a fork of a game (see Game.fork).
+        Stats, spells and effects are copied, a name is shared.
+
+        Args:
+            team (Team): A copy of a team of a player.
+            scheduler (Effect_scheduler): A scheduler of a fork, copies of effects are scheduled there.
+
+        Returns:
+            Player: A copy of a player.
+        """
+        player = Player.__new__(Player)
+        player.__dict__.update(self.__dict__)
+        state = self._state
+        player._state = Player_state(state.max_health_points, state.health_points, state.mana_points, state.armor)
+        player._team = team
+        player._spells = dict(self._spells)
+        player._effects = dict()
+        player._effects_by_title = dict()
+        player._scheduler = scheduler
+        player._undo_log = None
+        for e in self._effects.values():
+            e = e.copy(player)
+            player._effects[e.number] = e
+            if e.title in player._effects_by_title:
+                player._effects_by_title[e.title][e.number] = e
+            else:
+                player._effects_by_title[e.title] = {e.number: e}
+            scheduler.schedule(e)
+        return player
+
+    def _count_stun_spells(self) -> int:
+        return sum(1 for spell in self._spells if self._spells[spell] > 0 and SPELLS[spell].works_in_stun)
 
     def _check_points(self, points: int, message: str=""):
         if not isinstance(points, int) or points < 0:
@@ -74,23 +200,32 @@ class Player:
 
     @property
     def is_alive(self) -> bool:
-        return self._health_points > 0
+        return self._state.health_points > 0
 
     @property
     def score(self) -> int:
-        return self._health_points + self._mana_points if self.is_alive else 0
+        return self._state.health_points + self._state.mana_points if self.is_alive else 0
+
+    @property
+    def is_stunned(self) -> bool:
+        return self._is_stunned
+
+    def set_stunned(self, is_stunned: bool=True) -> None:
+        self.record_undo()
+        self._is_stunned = is_stunned
+        self.check_active()
 
     @property
     def health_points(self) -> int:
-        return self._health_points
+        return self._state.health_points
     
     @property
     def mana_points(self) -> int:
-        return self._mana_points 
+        return self._state.mana_points 
 
     @property
     def max_mana_points(self) -> int:
-        return self._max_health_points + 10
+        return self._state.max_health_points + 10
     
     @property
     def team(self):
@@ -99,6 +234,20 @@ class Player:
     def set_team(self, team: Iterable):
         self._team = team
 
+    @property
+    def state(self):
+        return self._state
+
+    def set_state(self, state) -> None:
+        """Replaces an object which stores stats of a player. A new state gets values of the old one.
+
+        Args:
+            state: An object with attributes max_health_points, health_points, mana_points and armor.
+        """
+        for field in Player_state.__slots__:
+            setattr(state, field, getattr(self._state, field))
+        self._state = state
+
     def damage(self, points: int) -> None:
         """A method allows to damage a player. It not allows to set health points < 0.
 
@@ -106,52 +255,133 @@ class Player:
             points (int): A value of damage.
         """
         self._check_points(points, f"The value to damage should be >= 0, not {points}!")
-        if self._health_points - points < 0:
-            self._health_points = 0
+        self.record_undo()
+        old_score = self.score
+        if self._state.health_points - points < 0:
+            self._state.health_points = 0
         else:
-            self._health_points -= points
+            self._state.health_points -= points
+        self._publish(old_score)
     
     def heal(self, points: int) -> None:
         self._check_points(points, f"The value to heal should be >= 0, not {points}!")
-        if self._health_points + points >= self._max_health_points:
-            self._health_points = self._max_health_points
+        self.record_undo()
+        old_score = self.score
+        if self._state.health_points + points >= self._state.max_health_points:
+            self._state.health_points = self._state.max_health_points
         else:
-            self._health_points += points
+            self._state.health_points += points
+        self._publish(old_score)
 
     def add_max_hp(self, points: int) -> None:
         self._check_points(points, f"The value to add max hp should be >= 0, not {points}!")
-        self._max_health_points += points
+        self.record_undo()
+        self._state.max_health_points += points
 
     def sub_max_hp(self, points: int) -> None:
         self._check_points(points, f"The value to sub max hp should be >= 0, not {points}!")
-        self._max_health_points -= points
+        self.record_undo()
+        self._state.max_health_points -= points
 
     def burn_mp(self, points: int) -> None:
         self._check_points(points, f"The value to burn mana points should be >= 0, not {points}!")
-        self._mana_points -= points
+        self.record_undo()
+        old_score = self.score
+        self._state.mana_points -= points
+        self._publish(old_score)
 
     def restore_mp(self, points: int) -> None:
         self._check_points(points, f"The value to resore mana points should be >= 0, not {points}!")
-        self._mana_points += points
-        if self._mana_points > self.max_mana_points:
-            self._mana_points = self.max_mana_points
+        self.record_undo()
+        old_score = self.score
+        self._state.mana_points += points
+        if self._state.mana_points > self.max_mana_points:
+            self._state.mana_points = self.max_mana_points
+        self._publish(old_score)
 
     def add_armor(self, points: int) -> None:
-        self._armor += points
+        self.record_undo()
+        self._state.armor += points
 
     def kill(self) -> None:
         """This method allows to kill a player with removing all his effects.
         """
-        self._health_points = 0
-        self._mana_points = 0
-        self._armor = 0
-        self._effects.clear()
+        self.record_undo()
+        old_score = self.score
+        self._state.health_points = 0
+        self._state.mana_points = 0
+        self._state.armor = 0
+        self.clean_effects(True)
+        self._publish(old_score)
 
-    def get_effects(self) -> list:
-        return self._effects.copy()
+    @property
+    def round(self) -> int:
+        """A current round for timers of effects. It is 0 if a player isn't in a game.
+        """
+        return self._scheduler.round if self._scheduler is not None else 0
 
-    def add_effect(self, title: str, timer: int=0, duration: int=1, is_locked: bool=False) -> None:
-        self._effects.append({"title": title, "timer": timer, "is_locked": is_locked, "duration": duration})
+    def set_scheduler(self, scheduler: Effect_scheduler) -> None:
+        """Sets a scheduler of effects. Effects which a player already has keep their timers.
+
+        Args:
+            scheduler (Effect_scheduler): A game-wide scheduler of effects.
+        """
+        shift = scheduler.round - self.round
+        self._scheduler = scheduler
+        for e in self._effects.values():
+            e.start += shift
+            scheduler.schedule(e)
+
+    def get_effects(self) -> List[Effect]:
+        return list(self._effects.values())
+
+    def has_effect(self, title: str) -> bool:
+        return bool(self._effects_by_title.get(title))
+
+    def has_active_effect(self, title: str) -> bool:
+        """Checks if a player has an effect which already works, not awaits.
+        """
+        round_num = self.round
+        return any(e.start <= round_num for e in self._effects_by_title.get(title, {}).values())
+
+    def add_effect(self, title: str, timer: int=0, duration: int=1, is_locked: bool=False) -> Effect:
+        """Adds an effect to a player.
+
+        Args:
+            title (str): A title of an effect from ALL_EFFECTS.
+            timer (int, optional): If it < 0, an effect awaits for -timer rounds. Defaults to 0.
+            duration (int, optional): How many rounds an effect works. Defaults to 1.
+            is_locked (bool, optional): Locked effects can be removed only by hard cleaning. Defaults to False.
+
+        Returns:
+            Effect: A new effect.
+        """
+        self.record_undo()
+        effect = Effect(title, self, self.round - timer, duration, is_locked)
+        self._effects[effect.number] = effect
+        if title in self._effects_by_title:
+            self._effects_by_title[title][effect.number] = effect
+        else:
+            self._effects_by_title[title] = {effect.number: effect}
+        if self._scheduler is not None:
+            self._scheduler.schedule(effect)
+        return effect
+
+    def discard_effect(self, effect: Effect) -> None:
+        """Removes an effect without any checks. A scheduler calls it for expired effects.
+
+        Args:
+            effect (Effect): An effect of a player.
+        """
+        self.record_undo()
+        del self._effects[effect.number]
+        same_effects = self._effects_by_title[effect.title]
+        del same_effects[effect.number]
+        if not same_effects:
+            del self._effects_by_title[effect.title]
+        if self._scheduler is not None:
+            self._scheduler.discard(effect)
+        effect.player = None
 
     def clean_effects(self, is_hard: bool=False) -> None:
         """Clean effects from a player. It can clean even not cleanable if is_hard is True.
@@ -159,62 +389,74 @@ class Player:
         Args:
             is_hard (bool, optional): A flag to clean all effects. Defaults to False.
         """
-        for e in self._effects.copy():
-            if self._is_clearable(e["title"], is_hard):
-                self._effects.remove(e)
+        for e in [e for e in self._effects.values() if is_hard or e.is_clearable]:
+            self.discard_effect(e)
 
     def remove_effect(self, title: str, is_hard=False) -> bool:
-        for e in self._effects: # search an effect title
-            if e["title"] == title and self._is_clearable(title, is_hard):
-                self._effects.remove(e)
+        for e in self._effects_by_title.get(title, {}).values(): # the oldest effect with a title
+            if is_hard or e.is_clearable:
+                self.discard_effect(e)
                 return True
         return False
 
     def remove_oldest_effect(self, is_hard: bool=False) -> bool:
-        for e in self._effects:
-            if self._is_clearable(e["title"], is_hard):
-                self._effects.remove(e)
+        for e in self._effects.values():
+            if is_hard or e.is_clearable:
+                self.discard_effect(e)
                 return True
         return False
 
     def remove_newest_effect(self, is_hard: bool=False) -> bool:
-        for e in self._effects[::-1]:
-            if self._is_clearable(e["title"], is_hard):
-                self._effects.remove(e)
+        for e in reversed(self._effects.values()):
+            if is_hard or e.is_clearable:
+                self.discard_effect(e)
                 return True
         return False
 
-    def _is_clearable(self, title: str, is_hard: bool) -> bool:
-        return is_hard or not self._effects[title]["is_locked"] and ALL_EFFECTS[title]["is_clearable"]
-
     def add_spell(self, spell_idx: int, count: int=1) -> None:
-        if spell_idx not in get_all_spells():
+        if spell_idx not in SPELLS_KEYS:
             raise ValueError(f"There is no spell {spell_idx} for adding!")
         if count <=0:
             raise ValueError(f"Can't add less than 1 spell!")
-        if spell_idx in self._spells:
-            self._spells[spell_idx] += count
-        else:
-            self._spells[spell_idx] = count
+        self.record_undo()
+        old_count = self._spells.get(spell_idx, 0)
+        self._spells[spell_idx] = old_count + count
+        if SPELLS[spell_idx].works_in_stun and old_count <= 0 < old_count + count:
+            self._stun_spells += 1
+            self.check_active()
 
     def remove_spell(self, spell_idx: int, count: int=1) -> None:
-        if spell_idx not in get_all_spells():
+        if spell_idx not in SPELLS_KEYS:
             raise ValueError(f"There is no spell {spell_idx} for adding!")
         if count <=0:
             raise ValueError(f"Can't add less than 1 spell!")
         if spell_idx in self._spells:
+            self.record_undo()
+            old_count = self._spells[spell_idx]
             self._spells[spell_idx] -= count
+            if SPELLS[spell_idx].works_in_stun and self._spells[spell_idx] <= 0 < old_count:
+                self._stun_spells -= 1
+                self.check_active()
+
+    def get_spells(self) -> list:
+        """Returns a list with spells which a player has.
+
+        Returns:
+            list: A list with tuples of form (spell_level, spell_index).
+        """
+        return [spell for spell in self._spells if self._spells[spell] > 0]
 
     def clear_spells(self) -> None:
+        self.record_undo()
         self._spells.clear()
+        self._stun_spells = 0
+        self.check_active()
 
-    def can_move(self):
+    def can_move(self) -> bool:
         if not self.is_alive: # can't move if dead
             return False
-        for spell in self._spells: # check if user have moves what works in stun
-            if ALL_SPELLS[spell]["works_in_stun"] == True:
-                return True
-        return not self._is_stunned # else just return if stunned
+        # spells which work in stun are counted when they are added or removed
+        return self._stun_spells > 0 or not self._is_stunned
 
     def dump(self) -> dict:
         """Allows to save a player as a dict.
@@ -223,11 +465,11 @@ class Player:
             dict: A dict with all players info.
         """
         return {
-            "max_health_points" : self._max_health_points,
-            "health_points" : self._health_points,
-            "mana_points" : self._mana_points,
-            "armor" : self._armor,
-            "effects" : self._effects
+            "max_health_points" : self._state.max_health_points,
+            "health_points" : self._state.health_points,
+            "mana_points" : self._state.mana_points,
+            "armor" : self._state.armor,
+            "effects" : [e.dump(self.round) for e in self._effects.values()]
         }
 
     def load(self, stored_player: dict):
@@ -236,8 +478,60 @@ class Player:
         Args:
             stored_player (dict): A dict with player's properties.
         """
-        self._max_health_points = int(stored_player["max_health_points"])
-        self._health_points = int(stored_player["health_points"])
-        self._mana_points = int(stored_player["mana_points"])
-        self._armor = int(stored_player["armor"])
-        self._effects = OrderedDict(stored_player["effects"])
+        self.record_undo()
+        old_score = self.score
+        self._state.max_health_points = int(stored_player["max_health_points"])
+        self._state.health_points = int(stored_player["health_points"])
+        self._state.mana_points = int(stored_player["mana_points"])
+        self._state.armor = int(stored_player["armor"])
+        self._publish(old_score)
+        self.clean_effects(True)
+        for e in stored_player["effects"]:
+            self.add_effect(e["title"], e["timer"], e["duration"], e["is_locked"])
+
+    def dump_bytes(self) -> bytes:
+        """Allows to save a player in a compact binary form. A name and a team are not saved.
+
+        Returns:
+            bytes: Packed stats, effects and spells of a player.
+        """
+        state = self._state
+        data = PLAYER_STRUCT.pack(state.max_health_points, state.health_points, state.mana_points, state.armor,
+                                  self._is_stunned, len(self._effects), len(self._spells))
+        if self._effects:
+            round_num = self.round
+            data += b"".join([EFFECT_STRUCT.pack(EFFECTS_INDEXES[e.title], round_num - e.start, e.duration, e.is_locked)
+                              for e in self._effects.values()])
+        pack_spell = SPELL_STRUCT.pack
+        return data + b"".join([pack_spell(level, index, spell_count) for (level, index), spell_count in self._spells.items()])
+
+    def load_bytes(self, data: bytes, offset: int=0) -> int:
+        """Loads all settings of a player from bytes made by dump_bytes.
+
+        Args:
+            data (bytes): A buffer with a stored player.
+            offset (int, optional): A position of a player in a buffer. Defaults to 0.
+
+        Returns:
+            int: A position in a buffer after a player.
+        """
+        self.record_undo()
+        max_hp, hp, mp, armor, self._is_stunned, effects_num, spells_num = PLAYER_STRUCT.unpack_from(data, offset)
+        offset += PLAYER_STRUCT.size
+        state = self._state
+        old_score = self.score
+        state.max_health_points, state.health_points, state.mana_points, state.armor = max_hp, hp, mp, armor
+        self._publish(old_score)
+        self.clean_effects(True)
+        for _ in range(effects_num):
+            title_idx, timer, duration, is_locked = EFFECT_STRUCT.unpack_from(data, offset)
+            offset += EFFECT_STRUCT.size
+            self.add_effect(EFFECTS_TITLES[title_idx], timer, duration, is_locked)
+        self._spells = dict()
+        for _ in range(spells_num):
+            level, index, spell_count = SPELL_STRUCT.unpack_from(data, offset)
+            offset += SPELL_STRUCT.size
+            self._spells[(level, index)] = spell_count
+        self._stun_spells = self._count_stun_spells()
+        self.check_active()
+        return offset
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""Headless simulation of games.
+Moves of players are given by move providers instead of a human input, so many seeded games
+can be played in a process pool, for example, for balance testing of spells.
+"""
+
+import copy
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from Objects.Game import Game
+from Objects.IO_handler import Headless_IO_handler
+from Objects.Spells import SPELLS, Spell_targets
+
+
+def random_policy(game: Game, player_name: str) -> Tuple[tuple, str]:
+    """Move provider which chooses a random spell of a player and a random target for it.
+
+    Args:
+        game (Game): A game where a player moves.
+        player_name (str): A name of a player.
+
+    Returns:
+        Tuple[tuple, str]: A spell and a name of a target (None if a target is chosen automatically).
+    """
+    player = game.search_player(player_name)
+    spells = player.get_spells() or [(0, 1)] # meditate if there are no spells
+    spell = game.random.choice(spells)
+    if SPELLS[spell].kind in (Spell_targets.SELF, Spell_targets.ALL):
+        return spell, None
+    targets = game.autotarget(player_name, spell)
+    return spell, game.random.choice(targets) if targets else None
+
+
+class Scripted_policy:
+    def __init__(self, script: Dict[str, List[Tuple[tuple, str]]]) -> None:
+        """Move provider which repeats moves from a script in a loop.
+
+        Args:
+            script (Dict[str, List[Tuple[tuple, str]]]): A dict, where keys are players names and values are lists with moves.
+        """
+        self._script = script
+        self._steps = dict.fromkeys(script, 0)
+
+    def __call__(self, game: Game, player_name: str) -> Tuple[tuple, str]:
+        moves = self._script[player_name]
+        move = moves[self._steps[player_name] % len(moves)]
+        self._steps[player_name] += 1
+        return move
+
+
+def play_game(random_seed: int,
+              teams: Dict[str, Iterable[str]],
+              providers: Union[Callable, Dict[str, Callable]]=random_policy,
+              rounds: int=30,
+              **game_kwargs) -> dict:
+    """Plays one headless game.
+
+    Args:
+        random_seed (int): A random seed of a game.
+        teams (Dict[str, Iterable[str]]): A dict, where keys are teams titles, and values are iterable objects with players names.
+        providers (Union[Callable, Dict[str, Callable]], optional): Move providers. Defaults to random_policy.
+        rounds (int, optional): A number of rounds. Defaults to 30.
+
+    Returns:
+        dict: Results of a game: a seed, titles of winners and scores of all teams.
+    """
+    game_kwargs.setdefault("loglevel", logging.CRITICAL)
+    game = Game(teams=teams,
+                rounds=rounds,
+                io_handler=Headless_IO_handler(providers),
+                random_seed=random_seed,
+                **game_kwargs)
+    game.run()
+    return {
+        "seed": random_seed,
+        "winners": sorted(game.get_winners()),
+        "scores": {t: game.get_team(t).get_score() for t in teams},
+    }
+
+
+def _play_games(random_seeds: Iterable[int], teams: Dict[str, Iterable[str]], providers: Union[Callable, Dict[str, Callable]],
+                *args, **kwargs) -> List[dict]:
+    # every game gets its own copy of providers, so states of providers (steps of scripts, generators of bots)
+    # don't depend on other games of a chunk
+    return [play_game(random_seed, teams, copy.deepcopy(providers), *args, **kwargs) for random_seed in random_seeds]
+
+
+def simulate(games_num: int,
+             teams: Dict[str, Iterable[str]],
+             providers: Union[Callable, Dict[str, Callable]]=random_policy,
+             rounds: int=30,
+             random_seed: int=0,
+             workers: int=None,
+             chunk_size: int=100,
+             **game_kwargs) -> Iterator[dict]:
+    """Plays games in a process pool and yields results of every game as soon as they are ready.
+    Seeds of games are random_seed, random_seed + 1, ..., so every game can be replayed with play_game.
+    Providers must be picklable, e.g. functions of a module or Scripted_policy objects.
+    Every game gets a copy of providers as they are passed, so stateful providers start every game afresh.
+
+    Args:
+        games_num (int): A number of games.
+        teams (Dict[str, Iterable[str]]): A dict, where keys are teams titles, and values are iterable objects with players names.
+        providers (Union[Callable, Dict[str, Callable]], optional): Move providers. Defaults to random_policy.
+        rounds (int, optional): A number of rounds in every game. Defaults to 30.
+        random_seed (int, optional): A seed of the first game. Defaults to 0.
+        workers (int, optional): A number of processes. Defaults to a number of processors.
+        chunk_size (int, optional): A number of games sent to a process at once. Defaults to 100.
+
+    Yields:
+        Iterator[dict]: Results of games in order of their completion.
+    """
+    seeds = iter(range(random_seed, random_seed + games_num))
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded number of chunks in flight not to hold all games in memory
+        max_in_flight = 2 * workers
+        in_flight = set()
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = [seed for _, seed in zip(range(chunk_size), seeds)]
+                if not chunk:
+                    break
+                in_flight.add(executor.submit(_play_games, chunk, teams, providers, rounds, **game_kwargs))
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+"""Binary snapshots of a whole game.
+A snapshot consists of a header, teams, players records, an index with offsets of players records and a state of a random generator:
+    header - a magic, a version, a number of the last round, a number of rounds, numbers of teams and players, offsets of the index and the random state
+    team - a title and a number of members; members of teams are stored one after another in players records
+    player - a name and a player saved by Player.dump_bytes
+All numbers are little-endian, strings are utf-8 with 2-byte length.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from struct import Struct
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from Objects.Player import Player
+from Objects.Team import Team
+
+if TYPE_CHECKING:
+    from Objects.Game import Game
+
+MAGIC = b"ASTR"
+VERSION = 1
+HEADER_STRUCT = Struct("<4sHHIIIIQQ")
+LENGTH_STRUCT = Struct("<H")
+MEMBERS_STRUCT = Struct("<I")
+OFFSET_STRUCT = Struct("<Q")
+RANDOM_STRUCT = Struct("<B625I?d")
+
+
+def _pack_str(string: str) -> bytes:
+    encoded = string.encode("utf-8")
+    return LENGTH_STRUCT.pack(len(encoded)) + encoded
+
+def _unpack_str(data, offset: int) -> Tuple[str, int]:
+    length, = LENGTH_STRUCT.unpack_from(data, offset)
+    offset += LENGTH_STRUCT.size
+    return str(data[offset:offset + length], "utf-8"), offset + length
+
+def pack_random_state(state: tuple) -> bytes:
+    version, internal_state, gauss_next = state
+    return RANDOM_STRUCT.pack(version, *internal_state, gauss_next is not None, gauss_next or 0.0)
+
+def unpack_random_state(data, offset: int=0) -> tuple:
+    version, *internal_state, has_gauss, gauss_next = RANDOM_STRUCT.unpack_from(data, offset)
+    return (version, tuple(internal_state), gauss_next if has_gauss else None)
+
+
+def dump_game(game: Game) -> bytes:
+    """Packs a whole game to bytes.
+
+    Args:
+        game (Game): A game.
+
+    Returns:
+        bytes: A snapshot of a game.
+    """
+    teams = game.get_teams()
+    parts = [b""] # a place for a header
+    offsets = list()
+    offset = HEADER_STRUCT.size
+    for t in teams:
+        part = _pack_str(t.title) + MEMBERS_STRUCT.pack(len(t))
+        parts.append(part)
+        offset += len(part)
+    for t in teams:
+        for name in t:
+            part = _pack_str(name) + t[name].dump_bytes()
+            parts.append(part)
+            offsets.append(offset)
+            offset += len(part)
+    index_offset = offset
+    parts.append(b"".join(OFFSET_STRUCT.pack(o) for o in offsets))
+    random_offset = index_offset + OFFSET_STRUCT.size * len(offsets)
+    parts.append(pack_random_state(game.random.getstate()))
+    parts[0] = HEADER_STRUCT.pack(MAGIC, VERSION, 0, game.round, game.rounds, len(teams), len(offsets), index_offset, random_offset)
+    return b"".join(parts)
+
+def save_game(game: Game, path: str, fsync: bool=True) -> None:
+    """Saves a snapshot of a game to a file. The file is replaced atomically,
+    so a crash while saving leaves the previous snapshot untouched.
+
+    Args:
+        game (Game): A game.
+        path (str): A path of a file.
+        fsync (bool, optional): Wait until data is written to a disk. Defaults to True.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dump_game(game))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class Game_snapshot:
+    def __init__(self, source) -> None:
+        """A snapshot of a game. A file is memory-mapped, and players are decoded only when they are requested.
+
+        Args:
+            source: A path of a file or bytes with a snapshot.
+
+        Raises:
+            ValueError: If data is not a snapshot or its version is not supported.
+        """
+        self._file = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._data = source
+        else:
+            self._file = open(source, "rb")
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.round, self.rounds, self._teams_num, self._players_num, self._index_offset, self._random_offset = \
+            HEADER_STRUCT.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError("It is not a snapshot of a game")
+        if version != VERSION:
+            raise ValueError(f"Unsupported version of a snapshot: {version}")
+        self._names: Dict[str, int] = None
+
+    def __enter__(self) -> Game_snapshot:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._players_num
+
+    def close(self) -> None:
+        if self._file:
+            self._data.close()
+            self._file.close()
+            self._file = None
+
+    def get_teams(self) -> List[Tuple[str, int]]:
+        """Returns titles of teams and numbers of their members.
+        """
+        teams = list()
+        offset = HEADER_STRUCT.size
+        for _ in range(self._teams_num):
+            title, offset = _unpack_str(self._data, offset)
+            members_num, = MEMBERS_STRUCT.unpack_from(self._data, offset)
+            offset += MEMBERS_STRUCT.size
+            teams.append((title, members_num))
+        return teams
+
+    def _offsets(self) -> Iterator[int]:
+        for i in range(self._players_num):
+            yield OFFSET_STRUCT.unpack_from(self._data, self._index_offset + i * OFFSET_STRUCT.size)[0]
+
+    def get_names(self) -> List[str]:
+        if self._names is None:
+            self._names = {_unpack_str(self._data, offset)[0]: offset for offset in self._offsets()}
+        return list(self._names)
+
+    def load_player(self, name: str) -> Player:
+        """Decodes only one player from a snapshot.
+
+        Args:
+            name (str): A name of a player.
+
+        Raises:
+            ValueError: If there is no player with this name.
+
+        Returns:
+            Player: A player without a team.
+        """
+        self.get_names()
+        if name not in self._names:
+            raise ValueError(f"No player with name {name} in a snapshot")
+        player = Player(name)
+        player.load_bytes(self._data, _unpack_str(self._data, self._names[name])[1])
+        return player
+
+    def get_random_state(self) -> tuple:
+        return unpack_random_state(self._data, self._random_offset)
+
+    def restore(self, **game_kwargs) -> Game:
+        """Makes a game from a snapshot. It continues from the round after the saved one.
+
+        Returns:
+            Game: A restored game.
+        """
+        from Objects.Game import Game
+        teams = list()
+        players = list()
+        offsets = self._offsets()
+        for title, members_num in self.get_teams():
+            team = Team(title)
+            for _ in range(members_num):
+                offset = next(offsets)
+                name, offset = _unpack_str(self._data, offset)
+                player = Player(name)
+                team.add(player)
+                players.append((player, offset))
+            teams.append(team)
+        game = Game(teams=teams, rounds=self.rounds, **game_kwargs)
+        game.set_round(self.round)
+        # effects are loaded after the round is set to keep their timers
+        for player, offset in players:
+            player.load_bytes(self._data, offset)
+            if player.is_stunned: # stuns of effects last until the next round
+                game.track_stunned(player)
+        game.random.setstate(self.get_random_state())
+        return game
+
+def load_game(path: str, **game_kwargs) -> Game:
+    """Restores a game from a file made by save_game.
+
+    Args:
+        path (str): A path of a file.
+
+    Returns:
+        Game: A restored game.
+    """
+    with Game_snapshot(path) as snapshot:
+        return snapshot.restore(**game_kwargs)
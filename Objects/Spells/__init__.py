@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from functools import cache
+import random
 from math import log
-from typing import TYPE_CHECKING
+from random import Random
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, NamedTuple, Union
 
 from Objects.Spells.functions import *
 
@@ -52,29 +54,75 @@ ALL_SPELLS = {
     }
 }
 
-def use_spell(level: int, index: int, caster: Player=None, target: Player=None):
-    if level in ALL_SPELLS:
-        if index in ALL_SPELLS[level]:
-            ALL_SPELLS[level][index]["func"](caster)
-        else:
-            raise ValueError(f"There is no index {index} of {level} level!")
-    else:
-        raise ValueError(f"There is no level {level}!")
-
-@cache
-def get_all_spells() -> list():
-    all_spells_idx = list()
-    for spell_lvl in ALL_SPELLS:
-        for spell_idx in ALL_SPELLS[spell_lvl]:
-            all_spells_idx.append((spell_lvl, spell_idx))
-    return all_spells_idx
-
-@cache
-def get_spell_description(level: int, index: int):
-    if level in ALL_SPELLS:
-        if index in ALL_SPELLS[level]:
-            return ALL_SPELLS[level][index].copy() # can't modify!
-        else:
+class Spell_description(NamedTuple):
+    """Immutable description of a spell compiled from ALL_SPELLS.
+    kind is SELF, DIRECTED, MASSIVE or ALL, side is ENEMY, ALLY or None if a spell can target anybody.
+    """
+    level: int
+    index: int
+    priority: int
+    type: int
+    works_in_stun: bool
+    target_type: Union[int, tuple]
+    kind: int
+    side: int
+    func: Callable
+
+    @property
+    def spell(self) -> tuple:
+        return (self.level, self.index)
+
+    @property
+    def is_directed(self) -> bool:
+        return self.kind == Spell_targets.DIRECTED
+
+
+def _compile_spell(level: int, index: int, spell: dict) -> Spell_description:
+    target_type = spell["target_type"]
+    targets = target_type if isinstance(target_type, tuple) else (target_type, )
+    side = None
+    if Spell_targets.ENEMY in targets:
+        side = Spell_targets.ENEMY
+    elif Spell_targets.ALLY in targets:
+        side = Spell_targets.ALLY
+    return Spell_description(level=level,
+                             index=index,
+                             priority=spell["priority"],
+                             type=spell.get("type", Spell_types.ALL),
+                             works_in_stun=spell.get("works_in_stun", False),
+                             target_type=target_type,
+                             kind=targets[0],
+                             side=side,
+                             func=spell["func"])
+
+# compiled spells by keys of form (spell_level, spell_index)
+SPELLS: Mapping[tuple, Spell_description] = MappingProxyType({
+    (level, index): _compile_spell(level, index, ALL_SPELLS[level][index])
+    for level in ALL_SPELLS for index in ALL_SPELLS[level]
+})
+SPELLS_KEYS = frozenset(SPELLS)
+# all priorities of spells in order of casting, spells with lower priorities are cast earlier
+SPELL_PRIORITIES = tuple(sorted({spell.priority for spell in SPELLS.values()}))
+
+def use_spell(level: int, index: int, caster: Player=None, target: Union[Player, Iterable[Player]]=None, rng: Random=None):
+    """Applies a spell to a target or to a caster if there is no target.
+    Massive spells can get many targets, they are changed at once (see Objects.States.Player_group).
+    Chances of spells are rolled by rng, a random generator of a game (the random module if not set).
+    """
+    if target is None:
+        target = caster
+    elif isinstance(target, (list, tuple, set)):
+        from Objects.States import Player_group
+        target = Player_group(target)
+    get_spell_description(level, index).func(target, rng or random)
+
+def get_all_spells() -> frozenset:
+    return SPELLS_KEYS
+
+def get_spell_description(level: int, index: int) -> Spell_description:
+    spell = SPELLS.get((level, index))
+    if spell is None:
+        if level in ALL_SPELLS:
             raise ValueError(f"There is no {index} spell of {level} level!")
-    else:
         raise ValueError(f"There is no {level} level of spells!")
+    return spell
@@ -4,57 +4,60 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from Objects.Effects import ALL_EFFECTS
 from utils import is_worked
 
 if TYPE_CHECKING:
+    from random import Random
+
     from Objects.Player import Player
 
-def meditation(p: Player) -> None:
+# every spell function gets a target and a random generator of a game and returns arguments of its message or None
+
+def meditation(p: Player, rng: Random) -> None:
     p.restore_mp(3)
-    p.add_effect(ALL_EFFECTS["mana_resist"])
-    p.add_effect(ALL_EFFECTS["prophecy"])
+    p.add_effect("mana_resist")
+    p.add_effect("prophecy")
 
-def run(p: Player) -> None:
+def run(p: Player, rng: Random) -> None:
     p.add_armor(1)
-    p.add_effect(ALL_EFFECTS["falling"])
+    p.add_effect("falling")
 
-def fly(p: Player) -> None:
+def fly(p: Player, rng: Random) -> None:
     p.restore_mp(1)
-    p.add_effect(ALL_EFFECTS["levitate"])
+    p.add_effect("levitate")
     
-def defence(p: Player) -> None:
-    p.add_effect(ALL_EFFECTS["damage_resist"])
+def defence(p: Player, rng: Random) -> None:
+    p.add_effect("damage_resist")
     effects = p.get_effects()
-    if len(effects) >= 2 or is_worked(0.4):
+    if len(effects) >= 2 or is_worked(0.4, rng):
         p.remove_oldest_effect() # remove 1 oldest effect
 
-def suicide(p: Player) -> None:
+def suicide(p: Player, rng: Random) -> None:
     p.kill()
 
-def first_aid(p: Player) -> None:
+def first_aid(p: Player, rng: Random) -> None:
     p.add_max_hp(2)
     p.heal(4)
 
-def shuffle_spells(p: Player) -> None:
+def shuffle_spells(p: Player, rng: Random) -> None:
     #TODO
     pass
 
-def fire_arrow(p: Player) -> None:
+def fire_arrow(p: Player, rng: Random) -> None:
     p.damage(6)
-    p.add_effect(ALL_EFFECTS["burn"], -1)
+    p.add_effect("burn", -1)
 
-def poison_spit(p: Player) -> None:
-    p.add_effect(ALL_EFFECTS["poison"], 0, 4)
+def poison_spit(p: Player, rng: Random) -> None:
+    p.add_effect("poison", 0, 4)
 
-def healing(p: Player) -> None:
-    p.add_effect(ALL_EFFECTS["healing"])
+def healing(p: Player, rng: Random) -> None:
+    p.add_effect("healing")
 
-def nightmare(p: Player) -> None:
-    p.add_effect(ALL_EFFECTS["nightmare"], -1, 1)
+def nightmare(p: Player, rng: Random) -> None:
+    p.add_effect("nightmare", -1, 1)
 
-def dispelling(p: Player) -> None:
+def dispelling(p: Player, rng: Random) -> None:
     p.clean_effects()
 
-def magic_shield(p: Player) -> None:
-    p.add_effect(ALL_EFFECTS["magic_shield"])
+def magic_shield(p: Player, rng: Random) -> None:
+    p.add_effect("magic_shield")
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""Array backed storage of players stats.
+Every stat is a NumPy array indexed by a slot of a player, and a Player keeps a thin view of its slot.
+It allows to apply spells to many targets by one vectorized operation. NumPy is an optional dependency.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from Objects.Player import Player
+
+STATS = ("max_health_points", "health_points", "mana_points", "armor")
+
+
+class Array_states:
+    def __init__(self, capacity: int=64) -> None:
+        """Storage of stats of many players, one array per stat.
+
+        Args:
+            capacity (int, optional): Initial number of slots, it grows when needed. Defaults to 64.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("Array states require NumPy")
+        self._size = 0
+        self.max_health_points = np.zeros(capacity, dtype=np.int64)
+        self.health_points = np.zeros(capacity, dtype=np.int64)
+        self.mana_points = np.zeros(capacity, dtype=np.int64)
+        self.armor = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        for stat in STATS:
+            array = getattr(self, stat)
+            setattr(self, stat, np.concatenate((array, np.zeros(max(len(array), 1), dtype=array.dtype))))
+
+    def add(self, player: Player) -> int:
+        """Moves stats of a player to a new slot of the storage.
+
+        Args:
+            player (Player): A player.
+
+        Returns:
+            int: A slot of a player.
+        """
+        if self._size == len(self.health_points):
+            self._grow()
+        slot = self._size
+        self._size += 1
+        player.set_state(Array_state_view(self, slot))
+        return slot
+
+    def copy(self) -> Array_states:
+        """Makes a storage with copies of all arrays, e.g. for a fork of a game. Slots of players stay the same.
+        """
+        states = Array_states.__new__(Array_states)
+        states._size = self._size
+        for stat in STATS:
+            setattr(states, stat, getattr(self, stat).copy())
+        return states
+
+    def slots(self, players: Iterable[Player]):
+        """Returns an array with slots of players or None if some of them are not stored here.
+
+        Args:
+            players (Iterable[Player]): Players.
+        """
+        slots = list()
+        for p in players:
+            state = p.state
+            if type(state) is not Array_state_view or state.states is not self:
+                return None
+            slots.append(state.slot)
+        return np.array(slots, dtype=np.intp)
+
+    def damage(self, slots, points: int) -> None:
+        self.health_points[slots] = np.maximum(self.health_points[slots] - points, 0)
+
+    def heal(self, slots, points: int) -> None:
+        self.health_points[slots] = np.minimum(self.health_points[slots] + points, self.max_health_points[slots])
+
+    def add_max_hp(self, slots, points: int) -> None:
+        self.max_health_points[slots] += points
+
+    def sub_max_hp(self, slots, points: int) -> None:
+        self.max_health_points[slots] -= points
+
+    def burn_mp(self, slots, points: int) -> None:
+        self.mana_points[slots] -= points
+
+    def restore_mp(self, slots, points: int) -> None:
+        self.mana_points[slots] = np.minimum(self.mana_points[slots] + points, self.max_health_points[slots] + 10)
+
+    def add_armor(self, slots, points: int) -> None:
+        self.armor[slots] += points
+
+
+class Array_state_view:
+    """Stats of a player which are stored in a slot of Array_states.
+    """
+    __slots__ = ("states", "slot")
+
+    def __init__(self, states: Array_states, slot: int) -> None:
+        self.states = states
+        self.slot = slot
+
+    @property
+    def max_health_points(self) -> int:
+        return int(self.states.max_health_points[self.slot])
+
+    @max_health_points.setter
+    def max_health_points(self, value: int) -> None:
+        self.states.max_health_points[self.slot] = value
+
+    @property
+    def health_points(self) -> int:
+        return int(self.states.health_points[self.slot])
+
+    @health_points.setter
+    def health_points(self, value: int) -> None:
+        self.states.health_points[self.slot] = value
+
+    @property
+    def mana_points(self) -> int:
+        return int(self.states.mana_points[self.slot])
+
+    @mana_points.setter
+    def mana_points(self, value: int) -> None:
+        self.states.mana_points[self.slot] = value
+
+    @property
+    def armor(self) -> int:
+        return int(self.states.armor[self.slot])
+
+    @armor.setter
+    def armor(self, value: int) -> None:
+        self.states.armor[self.slot] = value
+
+
+class Player_group:
+    def __init__(self, players: Iterable[Player]) -> None:
+        """Group of targets of a massive spell. It has the same methods as Player which change stats,
+        so spell functions can be applied to a group at once. If all players are stored in one Array_states,
+        stats are changed by vectorized operations, else every player is changed separately.
+
+        Args:
+            players (Iterable[Player]): Targets of a spell.
+        """
+        # a player is changed once even if it's targeted several times, else vectorized changes of stats
+        # are applied once for a slot but changes of scores are counted for every entry
+        self._players: List[Player] = list(dict.fromkeys(players))
+        self._states = None
+        self._slots = None
+        # distinct teams of players and indexes of teams of every player, they are found on the first change of scores
+        self._teams = None
+        self._team_indexes = None
+        if np is not None and self._players:
+            state = self._players[0].state
+            if type(state) is Array_state_view:
+                self._slots = state.states.slots(self._players)
+                if self._slots is not None:
+                    self._states = state.states
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def __iter__(self):
+        return iter(self._players)
+
+    def __repr__(self) -> str:
+        return f"<Player_group of {len(self._players)}>"
+
+    def _scores(self):
+        health_points = self._states.health_points[self._slots]
+        is_alive = health_points > 0
+        return is_alive, np.where(is_alive, health_points + self._states.mana_points[self._slots], 0)
+
+    def _publish_scores(self, deltas) -> None:
+        if self._teams is None:
+            indexes = dict()
+            self._team_indexes = np.array([indexes.setdefault(p.team, len(indexes)) for p in self._players], dtype=np.intp)
+            self._teams = list(indexes)
+        # changes of scores are summed for every team, so a team is updated once
+        team_deltas = np.bincount(self._team_indexes, weights=deltas, minlength=len(self._teams))
+        for team, delta in zip(self._teams, team_deltas):
+            if delta and team is not None:
+                team.add_score(int(delta))
+
+    def _apply(self, method: str, points: int, message: str, changes_score: bool=False) -> None:
+        if not isinstance(points, int) or points < 0:
+            raise ValueError(message)
+        if self._states is not None:
+            # players are saved to an undo log before arrays are changed
+            for p in self._players:
+                p.record_undo()
+            if not changes_score:
+                getattr(self._states, method)(self._slots, points)
+                return
+            was_alive, old_scores = self._scores()
+            getattr(self._states, method)(self._slots, points)
+            is_alive, new_scores = self._scores()
+            self._publish_scores(new_scores - old_scores)
+            # only players who died or revived are notified
+            for i in np.flatnonzero(was_alive != is_alive):
+                self._players[i].check_alive()
+        else:
+            for p in self._players:
+                getattr(p, method)(points)
+
+    def damage(self, points: int) -> None:
+        self._apply("damage", points, f"The value to damage should be >= 0, not {points}!", True)
+
+    def heal(self, points: int) -> None:
+        self._apply("heal", points, f"The value to heal should be >= 0, not {points}!", True)
+
+    def add_max_hp(self, points: int) -> None:
+        self._apply("add_max_hp", points, f"The value to add max hp should be >= 0, not {points}!")
+
+    def sub_max_hp(self, points: int) -> None:
+        self._apply("sub_max_hp", points, f"The value to sub max hp should be >= 0, not {points}!")
+
+    def burn_mp(self, points: int) -> None:
+        self._apply("burn_mp", points, f"The value to burn mana points should be >= 0, not {points}!", True)
+
+    def restore_mp(self, points: int) -> None:
+        self._apply("restore_mp", points, f"The value to resore mana points should be >= 0, not {points}!", True)
+
+    def add_armor(self, points: int) -> None:
+        if self._states is not None:
+            for p in self._players:
+                p.record_undo()
+            self._states.add_armor(self._slots, points)
+        else:
+            for p in self._players:
+                p.add_armor(points)
+
+    def kill(self) -> None:
+        for p in self._players:
+            p.kill()
+
+    def add_effect(self, *args, **kwargs) -> None:
+        for p in self._players:
+            p.add_effect(*args, **kwargs)
+
+    def clean_effects(self, *args, **kwargs) -> None:
+        for p in self._players:
+            p.clean_effects(*args, **kwargs)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from typing import Dict
+from typing import Dict, Set, Tuple
 
 from Objects.Player import Player
 
@@ -13,9 +13,17 @@ class Team:
             raise ValueError(f"Team's title must be a string, not {type(title)}")
         self._title: str = title
         self._members: Dict[Player] = dict()
+        self._game = None
+        # names of alive members are kept up to date by members, a tuple of them is cached until somebody dies or revives
+        self._alive: Set[str] = set()
+        self._alive_names: Tuple[str] = None
+        # names of members which can move, they are kept in the same way
+        self._active: Set[str] = set()
+        self._active_names: Tuple[str] = None
+        # a sum of scores of members, they publish every change
+        self._score = 0
         for m in members:
-            self._members[m.name] = m
-            m.set_team(self)
+            self._join(m)
 
     def __len__(self):
         return len(self._members)
@@ -51,20 +59,138 @@ class Team:
     def title(self) -> str:
         return self._title
 
+    @property
+    def game(self):
+        return self._game
+
+    def set_game(self, game) -> None:
+        """Adds a team and all its members to indexes of a game.
+
+        Args:
+            game (Game): A game where a team plays.
+        """
+        game.register_team(self)
+        for name in self._members:
+            game.register_player(self._members[name])
+        self._game = game
+
+    def fork(self, game, scheduler) -> "Team":
+        """Makes an independent copy of a team with copies of its members for a fork of a game (see Game.fork).
+
+        Args:
+            game (Game): A fork of a game.
+            scheduler (Effect_scheduler): A scheduler of effects of a fork.
+
+        Returns:
+            Team: A copy of a team. It isn't registered in a fork yet.
+        """
+        team = Team.__new__(Team)
+        team.__dict__.update(self.__dict__)
+        team._game = game
+        team._alive = set(self._alive)
+        team._active = set(self._active)
+        # cached tuples of names are immutable, so they are shared
+        team._members = {name: member.fork(team, scheduler) for name, member in self._members.items()}
+        return team
+
+    def get_undo_state(self) -> tuple:
+        """Saves a state of a team for an undo log (see Objects.Undo).
+        """
+        return self._score, set(self._alive), self._alive_names, set(self._active), self._active_names
+
+    def set_undo_state(self, state: tuple) -> None:
+        self._score, self._alive, self._alive_names, self._active, self._active_names = state
+
     def add(self, member: Player) -> None:
         if not isinstance(member, Player):
             raise ValueError(f"You try to add not a Player: {member}")
         elif member.name in self._members:
             raise ValueError(f"A Player {member.name} is already in the team")
         else:
-            self._members[member.name] = member
-            member.set_team(self)
+            if self._game is not None:
+                self._game.register_player(member)
+            self._join(member)
+
+    def _join(self, member: Player) -> None:
+        self._members[member.name] = member
+        member.set_team(self)
+        if member.is_alive:
+            self._alive.add(member.name)
+        if member.can_move():
+            self._active.add(member.name)
+        self._alive_names = None
+        self._active_names = None
+        self.add_score(member.score)
+
+    def add_score(self, delta: int) -> None:
+        """Changes a score of a team. Called by members when their scores change.
+
+        Args:
+            delta (int): A change of a score.
+        """
+        old_score = self._score
+        self._score += delta
+        if self._game is not None:
+            self._game.update_score(self, old_score)
+
+    def update_alive(self, member: Player) -> None:
+        """Called by a member when it dies or revives.
+
+        Args:
+            member (Player): A member of a team.
+        """
+        if member.is_alive:
+            self._alive.add(member.name)
+        else:
+            self._alive.discard(member.name)
+        self._alive_names = None
+        if self._game is not None:
+            self._game.invalidate_targets()
+
+    def update_active(self, member: Player) -> None:
+        """Called by a member when it gets or loses an ability to move.
+
+        Args:
+            member (Player): A member of a team.
+        """
+        if member.can_move():
+            self._active.add(member.name)
+        else:
+            self._active.discard(member.name)
+        self._active_names = None
+
+    @property
+    def active_names(self) -> Tuple[str]:
+        """Names of members which can move in order of joining.
+        """
+        if self._active_names is None:
+            self._active_names = tuple(name for name in self._members if name in self._active)
+        return self._active_names
+
+    @property
+    def active_num(self) -> int:
+        return len(self._active)
+
+    def is_active(self, name: str) -> bool:
+        return name in self._active
+
+    @property
+    def alive_names(self) -> Tuple[str]:
+        """Names of alive members in order of joining.
+        """
+        if self._alive_names is None:
+            self._alive_names = tuple(name for name in self._members if name in self._alive)
+        return self._alive_names
+
+    @property
+    def alive_num(self) -> int:
+        return len(self._alive)
 
     def get_score(self) -> int:
-        return sum(self._members[name].score for name in self._members)
+        return self._score
     
     def get_alive_members(self) -> list:
-        return [name for name in self._members.copy() if self._members[name].is_alive]  
+        return list(self.alive_names)
 
     def get_active_members(self) -> list:
         """Returns a list with active members names.
@@ -72,7 +198,7 @@ class Team:
         Returns:
             list: A list with active members names.
         """
-        return [name for name in self._members.copy() if self._members[name].can_move()]
+        return list(self.active_names)
     
     def get_members(self) -> list:
         """Returns a list with members names.
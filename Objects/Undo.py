@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""Undo log of a game for searches which try a round and revert it.
+A savepoint saves states of a game, its teams and its scheduler of effects at once, players are saved
+only before their first change after a savepoint, so a rollback costs as many changed objects.
+Every saved object has methods get_undo_state and set_undo_state.
+"""
+
+from typing import Dict, Iterable, List
+
+
+class Undo_log:
+    def __init__(self) -> None:
+        """Stack of savepoints. Every savepoint is a dict with states of objects by objects.
+        """
+        self._frames: List[Dict[object, tuple]] = list()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def savepoint(self, objects: Iterable) -> int:
+        """Starts a new savepoint.
+
+        Args:
+            objects (Iterable): Objects which are saved at once.
+
+        Returns:
+            int: A mark of a savepoint.
+        """
+        self._frames.append({obj: obj.get_undo_state() for obj in objects})
+        return len(self._frames) - 1
+
+    def save(self, obj) -> None:
+        """Saves a state of an object if it wasn't saved after the last savepoint. It's called before a change.
+
+        Args:
+            obj: An object with get_undo_state and set_undo_state.
+        """
+        if self._frames:
+            frame = self._frames[-1]
+            if obj not in frame:
+                frame[obj] = obj.get_undo_state()
+
+    def _check_mark(self, mark: int) -> int:
+        if mark is None:
+            mark = len(self._frames) - 1
+        if not 0 <= mark < len(self._frames):
+            raise ValueError(f"There is no savepoint {mark}")
+        return mark
+
+    def rollback(self, mark: int=None) -> None:
+        """Reverts all changes after a savepoint and removes it with all later savepoints.
+
+        Args:
+            mark (int, optional): A mark of a savepoint. Defaults to the last savepoint.
+
+        Raises:
+            ValueError: If there is no such savepoint.
+        """
+        mark = self._check_mark(mark)
+        while len(self._frames) > mark:
+            # later savepoints are reverted first, so the earliest states stay
+            for obj, state in self._frames.pop().items():
+                obj.set_undo_state(state)
+
+    def release(self, mark: int=None) -> None:
+        """Keeps changes after a savepoint and removes it with all later savepoints.
+        Their states are moved to the previous savepoint, so it still can be rolled back.
+
+        Args:
+            mark (int, optional): A mark of a savepoint. Defaults to the last savepoint.
+
+        Raises:
+            ValueError: If there is no such savepoint.
+        """
+        mark = self._check_mark(mark)
+        if mark > 0:
+            outer = self._frames[mark - 1]
+            for frame in self._frames[mark:]:
+                for obj, state in frame.items():
+                    outer.setdefault(obj, state)
+        del self._frames[mark:]
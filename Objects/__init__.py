@@ -1,7 +1,37 @@
 # -*- coding: utf-8 -*-
 
-from Objects.Game import Game
-from Objects.Player import Player
-from Objects.Team import Team
+"""Classes of the package are imported on the first use, so importing a single module
+(e.g. Objects.Player) doesn't import the whole game.
+"""
 
-__all__  = (Game, Player, Team)
+import sys
+from importlib import import_module
+from types import ModuleType
+
+# modules of classes which are available from the package
+_CLASSES = {
+    "Game": "Objects.Game",
+    "Player": "Objects.Player",
+    "Team": "Objects.Team",
+}
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name: str, value) -> None:
+        # importing a submodule sets it as an attribute of a package,
+        # but modules Game, Player and Team must not hide classes with the same names
+        if name in _CLASSES and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name: str):
+    if name in _CLASSES:
+        cls = getattr(import_module(_CLASSES[name]), name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ("Game", "Player", "Team")
@@ -1,6 +1,51 @@
 # -*- coding: utf-8 -*-
 
-from .english import ENG_TEXTS
-from .russian import RUS_TEXTS
+"""Locales of messages. Modules of locales are imported only on the first use,
+e.g. Objects.localization.RUS_TEXTS or get_locale("rus").
+"""
 
-__all__ = (ENG_TEXTS, RUS_TEXTS)
+from importlib import import_module
+from typing import Dict, Tuple
+
+# modules and their attributes with messages by names of locales
+LOCALES: Dict[str, Tuple[str, str]] = {
+    "eng": ("Objects.localization.english", "ENG_TEXTS"),
+    "rus": ("Objects.localization.russian", "RUS_TEXTS"),
+}
+_loaded: Dict[str, dict] = dict()
+
+
+def register_locale(name: str, module: str, attribute: str) -> None:
+    """Adds a locale which will be loaded on the first use.
+
+    Args:
+        name (str): A name of a locale, e.g. "eng".
+        module (str): An absolute name of a module with messages.
+        attribute (str): A name of a dict with messages in a module.
+    """
+    LOCALES[name] = (module, attribute)
+    _loaded.pop(name, None)
+
+def get_locale(name: str) -> dict:
+    """Returns messages of a locale. Its module is imported only once.
+
+    Args:
+        name (str): A name of a locale, e.g. "rus".
+
+    Raises:
+        ValueError: If there is no such locale.
+    """
+    if name not in _loaded:
+        if name not in LOCALES:
+            raise ValueError(f"Unknown locale {name}")
+        module, attribute = LOCALES[name]
+        _loaded[name] = getattr(import_module(module), attribute)
+    return _loaded[name]
+
+def __getattr__(attribute: str) -> dict:
+    for name in LOCALES:
+        if LOCALES[name][1] == attribute:
+            return get_locale(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {attribute!r}")
+
+__all__ = ("ENG_TEXTS", "RUS_TEXTS", "LOCALES", "get_locale", "register_locale")
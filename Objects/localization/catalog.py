@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""Compiled catalogs of messages.
+Nested dicts of a locale are flattened once: every message is found by a tuple of keys with one dict lookup,
+and its template is parsed in advance to the fastest form of formatting.
+"""
+
+from string import Formatter
+from typing import Dict, Hashable, Iterable, Tuple
+
+
+class Message_template:
+    CONSTANT = 0
+    POSITIONAL = 1
+    NAMED = 2
+    FORMAT = 3
+
+    __slots__ = ("text", "_kind", "_template", "_fields_num")
+
+    def __init__(self, text: str) -> None:
+        """A template of a message. Templates with only simple fields ({} or {name}) are converted
+        to %-templates, other templates are formatted by str.format.
+
+        Args:
+            text (str): A template in str.format syntax.
+        """
+        self.text = text
+        self._fields_num = 0
+        positional, named = list(), list()
+        parts = list()
+        for literal, field, spec, conversion in Formatter().parse(text):
+            parts.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if spec or conversion or "." in field or "[" in field:
+                self._kind, self._template = self.FORMAT, text
+                return
+            if field == "":
+                positional.append(field)
+                parts.append("%s")
+            elif not field.isdigit():
+                named.append(field)
+                parts.append(f"%({field})s")
+            else: # numbered fields can be in any order
+                self._kind, self._template = self.FORMAT, text
+                return
+        if not positional and not named:
+            self._kind, self._template = self.CONSTANT, text.format()
+        elif positional and named:
+            self._kind, self._template = self.FORMAT, text
+        elif positional:
+            self._kind, self._template = self.POSITIONAL, "".join(parts)
+            self._fields_num = len(positional)
+        else:
+            self._kind, self._template = self.NAMED, "".join(parts)
+
+    def __repr__(self) -> str:
+        return f"<Message_template {self.text!r}>"
+
+    def render(self, args: tuple=(), kwargs: dict=None) -> str:
+        """Formats a message. Extra arguments are ignored as by str.format.
+
+        Args:
+            args (tuple, optional): Positional arguments of a message. Defaults to ().
+            kwargs (dict, optional): Named arguments of a message. Defaults to None.
+
+        Returns:
+            str: A message.
+        """
+        kind = self._kind
+        if kind == self.CONSTANT:
+            return self._template
+        if kind == self.POSITIONAL and not kwargs and len(args) == self._fields_num:
+            return self._template % args
+        if kind == self.NAMED and kwargs is not None:
+            return self._template % kwargs
+        return self.text.format(*args, **(kwargs or {}))
+
+
+class Message_catalog:
+    def __init__(self, messages: dict) -> None:
+        """Flattens messages of a locale: every string is compiled to a Message_template,
+        other values (e.g. aliases of spells) are kept as sections.
+
+        Args:
+            messages (dict): Nested dicts with messages, e.g. RUS_TEXTS.
+        """
+        self._templates: Dict[Tuple[Hashable, ...], Message_template] = dict()
+        self._sections: Dict[Tuple[Hashable, ...], object] = dict()
+        self._flatten((), messages)
+
+    def _flatten(self, prefix: tuple, value) -> None:
+        if isinstance(value, str):
+            self._templates[prefix] = Message_template(value)
+            return
+        self._sections[prefix] = value
+        if isinstance(value, dict):
+            for k in value:
+                self._flatten(prefix + (k, ), value[k])
+
+    def __contains__(self, message_keys: Iterable) -> bool:
+        return tuple(message_keys) in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(self, message_keys: tuple) -> Message_template:
+        """Returns a template of a message or None if there is no such message.
+
+        Args:
+            message_keys (tuple): Keys of a message, e.g. ("events", "new_round").
+        """
+        return self._templates.get(message_keys)
+
+    def get_section(self, keys: tuple, default=None):
+        """Returns an original value by keys, e.g. a dict of aliases.
+
+        Args:
+            keys (tuple): Keys of a value, e.g. ("aliases", ).
+            default (optional): A value if there is nothing by keys. Defaults to None.
+        """
+        return self._sections.get(keys, default)
+
+    def render(self, message_keys: tuple, *args, **kwargs) -> str:
+        template = self._templates.get(message_keys)
+        if template is None:
+            raise KeyError(f"There is no message {message_keys}")
+        return template.render(args, kwargs)
+
+
+# catalogs by ids of locales; a locale is kept with its catalog, so its id can't be reused
+_catalogs: Dict[int, Tuple[dict, Message_catalog]] = dict()
+
+def get_catalog(messages: dict) -> Message_catalog:
+    """Returns a catalog of a locale. It's compiled only once.
+
+    Args:
+        messages (dict): Nested dicts with messages, e.g. RUS_TEXTS.
+    """
+    if id(messages) not in _catalogs:
+        _catalogs[id(messages)] = (messages, Message_catalog(messages))
+    return _catalogs[id(messages)][1]
@@ -11,31 +11,35 @@ RUS_TEXTS = {
                 "self_message": "{player_name} стремительно убегает",
                 "self_lose_message": "{player_name} не может убежать"
                 },
-            3 : {"title" : "Левитация",
+            3 : {"title" : "Защита",
+                "self_message": "{player_name} уходит в защиту",
+                "self_lose_message": "{player_name} не может уйти в защиту"
+                },
+            4 : {"title" : "Левитация",
                 "self_message": "{player_name} взмывает в воздух",
                 "self_lose_message": "{player_name} не может взлететь"
                 },
-            4: {"title" : "Фортуна",
-                "self_message": "{player_name} сбрасывает все свои заклинания, заменяя новыми",
-                "self_lose_message": "{player_name} не может сменить свои заклинания"
-            },
             5: {"title" : "Суицид",
                 "self_message": "{player_name} сводит счеты со своей жизнью...",
                 "self_lose_message": "{player_name} не удалось покончить с собой..."
             },
-            6: {"title" : "Обмен",
+            6: {"title" : "Фортуна",
+                "self_message": "{player_name} сбрасывает все свои заклинания, заменяя новыми",
+                "self_lose_message": "{player_name} не может сменить свои заклинания"
+            },
+            7: {"title" : "Первая помощь",
+                "self_message": "{player_name} перевязывает свои раны",
+                "self_lose_message": "{player_name} не может оказать себе первую помощь"
+            },
+            8: {"title" : "Обмен",
                 "self_message": "{player_name} обменивает {dropped_spells} на заклинание второго уровня",
                 "self_lose_message": "{player_name} не может обменять свои заклинания",
                 "self_lose_message2": "У {player_name} недостаточно заклинаний для обмена и он теряет все!"
                 },
-            7: {"title" : "Жертва",
+            9: {"title" : "Жертва",
                 "self_message": "{player_name}  жертвует {dropped_spells} ради заклинания третьего уровня",
                 "self_lose_message": "{player_name} не может пожертвовать своими заклинаниями"
                 },
-            8: {"title" : "Защита",
-                "self_message": "{player_name} уходит в защиту",
-                "self_lose_message": "{player_name} не может уйти в защиту"
-                },
         },
         1: { # 1 level
             1  : {"title" : "Огненная стрела",
@@ -73,12 +77,13 @@ RUS_TEXTS = {
     "aliases": {
         'м':  (0, 1),
         'б':  (0, 2),
-        'л':  (0, 3),
-        'ф':  (0, 4),
+        'з':  (0, 3),
+        'л':  (0, 4),
         'гг': (0, 5),
-        'о':  (0, 6),
-        'ж':  (0, 7),
-        'з':  (0, 8),
+        'ф':  (0, 6),
+        'п':  (0, 7),
+        'о':  (0, 8),
+        'ж':  (0, 9),
     },
     "effects": {
         1: {"title": "Горение", "message": "Горение наносит {player_name} {damage} урона"},
@@ -96,7 +101,9 @@ RUS_TEXTS = {
         "winner": "Победила команда {}",
         "ask_move": "Введите ходы пользователей в формате:\nКастер Ход Цель",
         "move_saved": "Записанный ход: {}, {}, {}",
-        "move_updated": "Ход обновлен: {}, {}, {}"
+        "move_updated": "Ход обновлен: {}, {}, {}",
+        "moves_report": "Записано ходов: {}, отклонено: {}",
+        "standings": "Счет после раунда {}:\n{}"
     },
     "warnings": {
         "player_not_exists": "Игрок {} не существует!",
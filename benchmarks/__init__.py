@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmarks of Astral. Every benchmark is a module which can be run as a script from the root of the repository,
+and python -m benchmarks runs all of them and compares results with a baseline (see benchmarks/__main__.py).
+"""
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""Suite of all benchmarks: python -m benchmarks from the root of the repository.
+Benchmarks of a game are run for every number of teams and every size of a team, games with more than
+--max-players players are skipped. Results are written as JSON, and they can be compared with results
+of another commit: the suite fails if a metric is worse than in a baseline by more than a tolerance.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks import import_time
+from benchmarks.game import BENCHMARKS
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(("git", "rev-parse", "HEAD"), cwd=import_time.ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(teams: List[int], sizes: List[int], benchmarks: List[str], max_players: int=20000, import_repeat: int=20) -> dict:
+    """Runs benchmarks.
+
+    Args:
+        teams (List[int]): Numbers of teams.
+        sizes (List[int]): Sizes of teams.
+        benchmarks (List[str]): Names of benchmarks of a game and "import" for the import time.
+        max_players (int, optional): Games with more players are skipped. Defaults to 20000.
+        import_repeat (int, optional): A number of processes for the import time. Defaults to 20.
+
+    Returns:
+        dict: Results with a commit, a version of Python and metrics of every benchmark.
+    """
+    results = list()
+    if "import" in benchmarks:
+        results.append({"benchmark": "import", "metrics": {f"{k}_ms": v for k, v in import_time.run(import_repeat).items()}})
+    for name in benchmarks:
+        if name == "import":
+            continue
+        for teams_num in teams:
+            for team_size in sizes:
+                if teams_num * team_size > max_players:
+                    continue
+                start = time.perf_counter()
+                metrics = BENCHMARKS[name](teams_num, team_size)
+                results.append({"benchmark": name, "teams": teams_num, "team_size": team_size, "metrics": metrics})
+                print(f"{name} {teams_num}x{team_size}: {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return {"commit": _commit(), "python": platform.python_version(), "results": results}
+
+def _key(result: dict) -> tuple:
+    return result["benchmark"], result.get("teams"), result.get("team_size")
+
+def compare(results: dict, baseline: dict, tolerance: float=0.25) -> List[str]:
+    """Finds metrics which are worse than in a baseline. Times must not grow and throughputs must not fall
+    by more than a tolerance. Metrics which aren't in a baseline are skipped.
+
+    Args:
+        results (dict): Results of run.
+        baseline (dict): Results of another commit.
+        tolerance (float, optional): An allowed relative change. Defaults to 0.25.
+
+    Returns:
+        List[str]: Descriptions of regressions.
+    """
+    baseline_metrics: Dict[tuple, dict] = {_key(r): r["metrics"] for r in baseline["results"]}
+    regressions = list()
+    for result in results["results"]:
+        old_metrics = baseline_metrics.get(_key(result), dict())
+        for metric, value in result["metrics"].items():
+            old_value = old_metrics.get(metric)
+            if not old_value:
+                continue
+            change = value / old_value - 1
+            if metric.endswith("_per_second"):
+                change = -change
+            if change > tolerance:
+                name = " ".join(str(k) for k in _key(result) if k is not None)
+                regressions.append(f"{name} {metric}: {old_value:.2f} -> {value:.2f}")
+    return regressions
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--teams", type=int, nargs="+", default=[2, 10, 100, 1000], help="Numbers of teams")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000], help="Sizes of teams")
+    parser.add_argument("--max-players", type=int, default=20000, help="Games with more players are skipped")
+    parser.add_argument("--benchmarks", nargs="+", choices=("import", *BENCHMARKS), default=["import", *BENCHMARKS],
+                        help="Benchmarks to run")
+    parser.add_argument("--import-repeat", type=int, default=20, help="A number of processes for the import time")
+    parser.add_argument("--output", help="A JSON file for results, they are printed if it's not set")
+    parser.add_argument("--baseline", help="A JSON file with results of another commit")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="An allowed relative change of a metric")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    results = run(args.teams, args.sizes, args.benchmarks, args.max_players, args.import_repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
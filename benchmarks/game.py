@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmarks of a game at scale. Every benchmark gets a number of teams and a size of a team,
+makes a headless game and returns its metrics: times end with "_ms" or "_us", throughputs end with "_per_second".
+"""
+
+import argparse
+import io
+import logging
+import statistics
+import time
+from typing import Callable, Dict
+
+from Objects.Game import Game
+from Objects.IO_handler import Headless_IO_handler, Std_IO_handler
+from Objects.Simulation import random_policy
+
+
+def make_game(teams_num: int, team_size: int, **game_kwargs) -> Game:
+    """Makes a silent game where moves are chosen by random_policy.
+    """
+    game_kwargs.setdefault("loglevel", logging.CRITICAL)
+    game_kwargs.setdefault("io_handler", Headless_IO_handler(random_policy))
+    teams = {f"t{t}": [f"p{t}_{i}" for i in range(team_size)] for t in range(teams_num)}
+    return Game(teams=teams, **game_kwargs)
+
+def _median(func: Callable[[], None], repeat: int) -> float:
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def _enemy(game: Game, player_name: str, i: int) -> str:
+    enemies = game.get_targets(game.search_player(player_name).team)[0]
+    return enemies[i % len(enemies)] if enemies else None
+
+
+def bench_moves(teams_num: int, team_size: int, repeat: int=5) -> Dict[str, float]:
+    """Validation of moves by Game.get_moves: every alive player sends a move in one batch.
+    Half of players attack enemies by directed spells, others meditate.
+    """
+    handler = Headless_IO_handler(random_policy)
+    game = make_game(teams_num, team_size, io_handler=handler)
+    game.start_round()
+    names = game.get_alive_players()
+    batch = [(name, (1, 1), _enemy(game, name, i)) if i % 2 else (name, (0, 1)) for i, name in enumerate(names)]
+    def get_moves():
+        handler.submit_moves(batch)
+        game.get_moves()
+    seconds = _median(get_moves, repeat)
+    return {"get_moves_ms": seconds * 1000, "moves_per_second": len(batch) / seconds}
+
+def bench_rounds(teams_num: int, team_size: int, rounds: int=5) -> Dict[str, float]:
+    """A whole game by Game.run with random moves: getting moves, resolution of spells and effects.
+    """
+    game = make_game(teams_num, team_size, rounds=rounds)
+    start = time.perf_counter()
+    game.run()
+    seconds = time.perf_counter() - start
+    return {"round_ms": seconds / rounds * 1000}
+
+def bench_scores(teams_num: int, team_size: int, repeat: int=1000) -> Dict[str, float]:
+    """Team.get_score of all teams and Game.get_winners, also after changes of scores by damage.
+    """
+    game = make_game(teams_num, team_size)
+    teams = game.get_teams()
+    players = [game.search_player(name) for name in game.get_alive_players()]
+    def get_scores():
+        for t in teams:
+            t.get_score()
+    def damage():
+        for i in range(repeat):
+            players[i % len(players)].damage(1)
+    return {
+        "get_scores_us": _median(get_scores, repeat) * 1e6,
+        "get_winners_us": _median(game.get_winners, repeat) * 1e6,
+        "damage_per_second": repeat / _median(damage, 5),
+    }
+
+def bench_effects(teams_num: int, team_size: int, effects_num: int=4) -> Dict[str, float]:
+    """Effects of all players: adding, searching, expiry by the scheduler and cleaning.
+    """
+    game = make_game(teams_num, team_size)
+    players = [game.search_player(name) for name in game.get_all_players()]
+    operations = len(players) * effects_num
+    def add():
+        for p in players:
+            for i in range(effects_num):
+                p.add_effect("burn" if i % 2 else "mana_resist", 0, i + 1)
+    def search():
+        for p in players:
+            for _ in range(effects_num):
+                p.has_active_effect("burn")
+    start = time.perf_counter()
+    add()
+    added = time.perf_counter() - start
+    searched = _median(search, 3)
+    start = time.perf_counter()
+    for round_num in range(1, effects_num + 1): # every round some effects expire
+        game.set_round(round_num)
+    expired = time.perf_counter() - start
+    add()
+    start = time.perf_counter()
+    for p in players:
+        p.clean_effects(True)
+    cleaned = time.perf_counter() - start
+    return {
+        "add_per_second": operations / added,
+        "search_per_second": operations / searched,
+        "expire_per_second": operations / expired,
+        "clean_per_second": operations / cleaned,
+    }
+
+def bench_messages(teams_num: int, team_size: int, repeat: int=5) -> Dict[str, float]:
+    """Rendering of messages by Game.print_message to a buffered text stream: a message about a move of every player.
+    """
+    stream = io.StringIO()
+    handler = Std_IO_handler(buffered=True, out_stream=stream)
+    game = make_game(teams_num, team_size, io_handler=handler)
+    names = game.get_all_players()
+    def render():
+        for name in names:
+            game.print_message(("events", "move_saved"), name, (1, 1), name)
+            game.print_message(("spells", 1, 1, "target_message"), player_name=name, target_name=name)
+        handler.flush()
+        stream.seek(0)
+        stream.truncate()
+    return {"messages_per_second": 2 * len(names) / _median(render, repeat)}
+
+BENCHMARKS: Dict[str, Callable[[int, int], Dict[str, float]]] = {
+    "moves": bench_moves,
+    "rounds": bench_rounds,
+    "scores": bench_scores,
+    "effects": bench_effects,
+    "messages": bench_messages,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmark", choices=tuple(BENCHMARKS), help="A benchmark to run")
+    parser.add_argument("--teams", type=int, default=2, help="A number of teams")
+    parser.add_argument("--team-size", type=int, default=10, help="A number of players in every team")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    for metric, value in BENCHMARKS[args.benchmark](args.teams, args.team_size).items():
+        print(f"{metric}: {value:.2f}")
+
+if __name__ == "__main__":
+    main()
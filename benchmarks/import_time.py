@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark of startup: how long a new process imports the game.
+It's paid by every worker of a process pool and every run of run.py.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# code which is run in a new process; Game is taken from the package as run.py does
+STATEMENT = "from Objects import Game"
+
+
+def _measure(code: str, repeat: int) -> float:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run((sys.executable, "-c", code), cwd=ROOT, env=env, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def run(repeat: int=20, statement: str=STATEMENT) -> Dict[str, float]:
+    """Measures median times of a bare interpreter and of an interpreter which runs a statement.
+
+    Args:
+        repeat (int, optional): A number of processes for every measure. Defaults to 20.
+        statement (str, optional): Imports to measure. Defaults to STATEMENT.
+
+    Returns:
+        Dict[str, float]: Times in milliseconds: "interpreter", "total" and "import" which is their difference.
+    """
+    interpreter = _measure("pass", repeat) * 1000
+    total = _measure(statement, repeat) * 1000
+    return {"interpreter": interpreter, "total": total, "import": total - interpreter}
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="A number of processes for every measure")
+    parser.add_argument("--target", type=float, default=75.0, help="Maximal time of imports in milliseconds")
+    parser.add_argument("--statement", default=STATEMENT, help="Imports to measure")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    result = run(args.repeat, args.statement)
+    print(f"interpreter: {result['interpreter']:.1f} ms, total: {result['total']:.1f} ms, import: {result['import']:.1f} ms")
+    if result["import"] > args.target:
+        print(f"Imports take more than {args.target} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
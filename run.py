@@ -1,6 +1,6 @@
 import argparse
 
-from Objects import Game, Player, Team, Localization
+from Objects import Game, Player, Team, localization
 
 """Script for easy running of Astral.
 """
@@ -19,7 +19,7 @@ def main() -> None:
     """Main function.
     """
     # args = parse_args()
-    game = Game(teams=(Team("1", Player("lol")), Team("2", Player("kek"))), rounds=2, messages=Localization.RUS_TEXTS)
+    game = Game(teams=(Team("1", Player("lol")), Team("2", Player("kek"))), rounds=2, messages=localization.RUS_TEXTS)
     game.run()
 
 if __name__ == "__main__":
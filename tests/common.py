@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Iterator, Tuple
+
+from Objects.Game import Game
+from Objects.IO_handler import Headless_IO_handler
+from Objects.Player import Player
+from Objects.Simulation import random_policy
+
+
+def silent_kwargs() -> dict:
+    """Arguments of a game which prints nothing and whose moves are chosen by random_policy.
+    """
+    return {"loglevel": logging.CRITICAL, "io_handler": Headless_IO_handler(random_policy)}
+
+def make_game(random_seed: int, rounds: int=25, **game_kwargs) -> Game:
+    """Makes a silent game of two teams.
+    """
+    return Game(teams={"a": ["a1", "a2"], "b": ["b1", "b2"]}, rounds=rounds, random_seed=random_seed,
+                **{**silent_kwargs(), **game_kwargs})
+
+def play_round(game: Game) -> None:
+    game.start_round()
+    game.play_round(game.get_moves())
+
+def game_state(game: Game) -> dict:
+    """Everything which must be restored: stats, absolute rounds of effects, spells, scores and a random generator.
+    """
+    players = dict()
+    for name in game.get_all_players():
+        p = game.search_player(name)
+        players[name] = (p.health_points, p.mana_points, p.is_stunned, sorted(p.get_spells()),
+                         [(e.title, e.start, e.duration, e.is_locked) for e in p.get_effects()], p.dump_bytes())
+    return {"round": game.round, "players": players, "standings": game.get_standings(),
+            "alive": sorted(game.get_alive_players()), "random": game.random.getstate()}
+
+def scenario(random_seed: int) -> Iterator[Tuple[str, Game]]:
+    """Plays a seeded game with deaths, stuns, a player who joins late, a rolled back savepoint and a fork.
+    Yields a description of a step and a game after every step.
+    """
+    game = make_game(random_seed, rounds=30)
+    while not game.is_finished:
+        play_round(game)
+        yield f"round {game.round}", game
+        if game.round == 3:
+            game.get_team("b").add(Player("b3"))
+            yield "b3 joined", game
+        elif game.round == 5:
+            game.search_player("a1").kill()
+            yield "a1 killed", game
+        elif game.round == 7:
+            for name in game.get_alive_players():
+                game.search_player(name).set_stunned()
+            yield "everybody stunned", game
+        elif game.round == 9:
+            mark = game.savepoint()
+            play_round(game)
+            play_round(game)
+            yield "savepoint", game
+            game.rollback(mark)
+            yield "rollback", game
+        elif game.round == 12:
+            fork = game.fork(silent_kwargs()["io_handler"])
+            while not fork.is_finished:
+                play_round(fork)
+                yield f"fork round {fork.round}", fork
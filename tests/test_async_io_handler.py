@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import logging
+import unittest
+
+from Objects.Async_IO_handler import Async_IO_handler
+from Objects.Game import Game
+
+
+class Test_async_IO_handler(unittest.TestCase):
+    def test_deadline_and_default_move(self):
+        deadline = 0.3
+
+        async def play():
+            handler = Async_IO_handler(deadline=deadline, default_move=("02", None))
+            await handler.start()
+            game = Game(teams={"a": ["a1"], "b": ["b1"]}, rounds=2, loglevel=logging.CRITICAL, io_handler=handler, random_seed=0)
+            played = list()
+            play_round = game.play_round
+            def record(moves):
+                played.append({name: dict(move) for name, move in moves.items()})
+                play_round(moves)
+            game.play_round = record
+            host, port = handler.address
+            _, active = await asyncio.open_connection(host, port)
+            active.write(b"a1\n01\n01\n")
+            _, stalled = await asyncio.open_connection(host, port)
+            stalled.write(b"b1\n") # it never sends moves
+            await asyncio.sleep(0.05)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await game.run_async()
+            elapsed = loop.time() - start
+            active.close()
+            stalled.close()
+            await handler.aclose()
+            return played, elapsed
+
+        played, elapsed = asyncio.run(play())
+        self.assertEqual(len(played), 2)
+        for moves in played:
+            self.assertEqual(moves["a1"]["spell"], (0, 1))
+            self.assertEqual(moves["b1"]["spell"], (0, 2))
+        # every round waits for the stalled client until its deadline and not longer
+        self.assertGreaterEqual(elapsed, 2 * deadline)
+        self.assertLess(elapsed, 2 * deadline + 0.5)
+
+    def test_slow_client_is_disconnected(self):
+        async def flood():
+            handler = Async_IO_handler(max_buffer=1 << 16)
+            await handler.start()
+            host, port = handler.address
+            _, writer = await asyncio.open_connection(host, port)
+            writer.write(b"a1\n") # it never reads messages
+            await asyncio.sleep(0.05)
+            self.assertIn("a1", handler._writers)
+            message = "x" * (1 << 16)
+            for _ in range(1024):
+                handler.print(message)
+                if "a1" not in handler._writers:
+                    break
+            connected = "a1" in handler._writers
+            writer.close()
+            await handler.aclose()
+            return connected
+
+        self.assertFalse(asyncio.run(flood()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from Objects.Broadcast import Event_broadcaster, Overflow_policies
+
+LOCALES = {
+    "first": {"events": {"new_round": "Round {}"}},
+    "second": {"events": {"new_round": "Раунд №{}"}},
+}
+
+
+class Test_broadcaster(unittest.TestCase):
+    def setUp(self):
+        self.broadcaster = Event_broadcaster(LOCALES)
+        self.rendered = list()
+        render = self.broadcaster._render
+        def count(locale, *args):
+            self.rendered.append(locale)
+            return render(locale, *args)
+        self.broadcaster._render = count
+
+    def emit_rounds(self, rounds_num: int) -> None:
+        for round_num in range(rounds_num):
+            self.broadcaster.emit(("events", "new_round"), (round_num, ))
+
+    def test_disconnect(self):
+        subscription = self.broadcaster.subscribe("first", max_pending=2, overflow=Overflow_policies.DISCONNECT)
+        self.emit_rounds(4)
+        self.assertTrue(subscription.is_closed)
+        self.assertEqual(subscription.dropped, 1)
+        self.assertNotIn(subscription, self.broadcaster._subscriptions["first"])
+        self.assertEqual(len(self.broadcaster), 0)
+        # queued messages can be read after a subscription is closed
+        self.assertEqual(subscription.drain(), b"Round 0\nRound 1\n")
+        # events are rendered while there is a subscriber, and nothing is rendered for the second locale
+        self.assertEqual(self.rendered, ["first"] * 3)
+
+    def test_drop_oldest(self):
+        subscription = self.broadcaster.subscribe("first", max_pending=2, overflow=Overflow_policies.DROP_OLDEST)
+        self.emit_rounds(4)
+        self.assertFalse(subscription.is_closed)
+        self.assertEqual(subscription.dropped, 2)
+        self.assertIn(subscription, self.broadcaster._subscriptions["first"])
+        self.assertEqual(subscription.drain(), b"Round 2\nRound 3\n")
+        self.assertEqual(self.rendered, ["first"] * 4)
+
+    def test_render_once_for_locale(self):
+        subscriptions = [self.broadcaster.subscribe("second") for _ in range(3)]
+        self.emit_rounds(2)
+        self.assertEqual(self.rendered, ["second"] * 2)
+        first, *others = [s.get_nowait() for s in subscriptions]
+        self.assertEqual(first, "Раунд №0\n".encode("utf-8"))
+        for data in others: # all subscribers share the same bytes
+            self.assertIs(data, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# plays a seeded headless game and prints its results and standings
+SCRIPT = """
+import json, sys
+from Objects.Game import Game
+from Objects.IO_handler import Headless_IO_handler
+from Objects.Simulation import random_policy
+game = Game(teams={"a": ["a1", "a2"], "b": ["b1", "b2"], "c": ["c1", "c2"]}, rounds=20, loglevel=50,
+            io_handler=Headless_IO_handler(random_policy), random_seed=int(sys.argv[1]), batched_random=sys.argv[2] == "1")
+game.run()
+print(json.dumps({"standings": game.get_standings(), "winners": sorted(game.get_winners())}))
+"""
+
+
+def play_in_process(random_seed: int, hash_seed: int, batched_random: bool=False) -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONHASHSEED=str(hash_seed))
+    output = subprocess.run((sys.executable, "-c", SCRIPT, str(random_seed), "1" if batched_random else "0"),
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+class Test_determinism(unittest.TestCase):
+    def test_same_seed_in_processes(self):
+        for random_seed in (0, 7):
+            results = [play_in_process(random_seed, hash_seed) for hash_seed in (0, 1, 12345)]
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0], results[2])
+
+    def test_same_seed_in_processes_with_batched_random(self):
+        for random_seed in (0, 7):
+            results = [play_in_process(random_seed, hash_seed, True) for hash_seed in (0, 1, 12345)]
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[0], results[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
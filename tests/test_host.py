@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import unittest
+
+from Objects.Host import Game_host
+from Objects.IO_handler import Headless_IO_handler
+from tests.common import make_game
+
+
+def failing_policy(game, player_name):
+    raise RuntimeError("A provider failed")
+
+
+class Test_host(unittest.TestCase):
+    def test_stats(self):
+        async def run():
+            host = Game_host(max_games=2)
+            for random_seed in range(4):
+                host.submit(make_game(random_seed, rounds=5))
+            host.submit(make_game(4, rounds=5, io_handler=Headless_IO_handler(failing_policy)))
+            stats = [host.get_stats()]
+            await asyncio.sleep(0)
+            stats.append(host.get_stats())
+            with self.assertLogs("Astral", "ERROR"):
+                await host.join()
+            stats.append(host.get_stats())
+            return stats
+
+        submitted, started, ended = asyncio.run(run())
+        self.assertEqual(submitted, {"waiting": 5, "running": 0, "finished": 0, "failed": 0})
+        self.assertEqual(started["running"], 2)
+        self.assertEqual(started["waiting"], 3)
+        self.assertEqual(ended, {"waiting": 0, "running": 0, "finished": 4, "failed": 1})
+
+    def test_max_waiting(self):
+        async def run():
+            host = Game_host(max_games=1, max_waiting=2)
+            host.submit(make_game(0, rounds=2))
+            host.submit(make_game(1, rounds=2))
+            with self.assertRaises(RuntimeError):
+                host.submit(make_game(2, rounds=2))
+            await host.join()
+            # places are free again after games end
+            host.submit(make_game(3, rounds=2))
+            await host.join()
+            return host.get_stats()
+
+        self.assertEqual(asyncio.run(run())["finished"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
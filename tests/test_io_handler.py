@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import io
+import logging
+import unittest
+
+from Objects import Game, Player, Team, localization
+from Objects.IO_handler import Headless_IO_handler, Std_IO_handler
+from Objects.Simulation import random_policy
+
+
+class Test_headless_IO_handler(unittest.TestCase):
+    def test_async_batch_has_all_moves(self):
+        handler = Headless_IO_handler(random_policy)
+        game = Game(teams={"a": ["a1", "a2"], "b": ["b1"]}, loglevel=logging.CRITICAL, io_handler=handler, random_seed=1)
+        game.start_round()
+        batch = asyncio.run(handler.get_moves_batch_async(game.get_alive_players()))
+        self.assertEqual([name for move in batch for name in move], ["a1", "a2", "b1"])
+
+
+class Input_stream(io.StringIO):
+    """An input which remembers everything written to an output when a line is read.
+    """
+    def __init__(self, text: str, out_stream: io.StringIO) -> None:
+        super().__init__(text)
+        self.out_stream = out_stream
+        self.seen = list()
+
+    def readline(self, *args) -> str:
+        self.seen.append(self.out_stream.getvalue())
+        return super().readline(*args)
+
+
+class Test_std_IO_handler(unittest.TestCase):
+    def play(self, buffered: bool):
+        out_stream = io.StringIO()
+        in_stream = Input_stream("p1 01\np2 02\np1 01\np2 01\n", out_stream)
+        handler = Std_IO_handler(buffered=buffered, in_stream=in_stream, out_stream=out_stream)
+        game = Game(teams=(Team("1", Player("p1")), Team("2", Player("p2"))), rounds=2, loglevel=logging.CRITICAL,
+                    messages=localization.RUS_TEXTS, io_handler=handler, random_seed=0)
+        game.run()
+        return in_stream.seen, out_stream.getvalue()
+
+    def test_buffered_output_is_flushed_in_order(self):
+        seen, output = self.play(True)
+        expected_seen, expected_output = self.play(False)
+        # a player sees all messages before every input, and everything is written at the end of a game
+        self.assertEqual(seen, expected_seen)
+        self.assertEqual(output, expected_output)
+        self.assertIn("Раунд №2", seen[2])
+        self.assertNotIn("Раунд №2", seen[1])
+        self.assertIn("Победил", output[len(seen[-1]):])
+
+
+if __name__ == "__main__":
+    unittest.main()
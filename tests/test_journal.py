@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import tempfile
+import unittest
+
+from Objects.Journal import Journal_writer, Replay
+from tests.common import game_state, make_game, play_round
+
+
+class Test_journal(unittest.TestCase):
+    def test_replay_every_round(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.journal")
+            for random_seed in range(5):
+                journal = Journal_writer(path, keyframe_interval=7)
+                game = make_game(random_seed, journal=journal)
+                game.start()
+                states = dict()
+                while not game.is_finished:
+                    play_round(game)
+                    states[game.round] = game_state(game)
+                journal.close()
+                with Replay(path) as replay:
+                    for round_num, state in states.items():
+                        replayed = replay.seek(round_num, loglevel=logging.CRITICAL)
+                        self.assertEqual(game_state(replayed), state, f"seed {random_seed}, round {round_num}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from Objects.Spells import SPELLS
+from tests.common import scenario
+
+
+def can_move(player) -> bool:
+    """Counts an ability to move from scratch instead of the counter of spells which work in stun.
+    """
+    return player.is_alive and (not player.is_stunned or any(SPELLS[spell].works_in_stun for spell in player.get_spells()))
+
+
+class Test_members(unittest.TestCase):
+    def test_members_are_tracked_incrementally(self):
+        for random_seed in range(5):
+            for step, game in scenario(random_seed):
+                message = f"seed {random_seed}, {step}"
+                alive = dict()
+                for team in game.get_teams():
+                    # a brute-force scan of members
+                    alive[team.title] = [name for name in team if team[name].is_alive]
+                    active = [name for name in team if can_move(team[name])]
+                    self.assertEqual(sorted(team.get_alive_members()), sorted(alive[team.title]), message)
+                    self.assertEqual(sorted(team.get_active_members()), sorted(active), message)
+                    self.assertEqual(team.alive_num, len(alive[team.title]), message)
+                    self.assertEqual(team.active_num, len(active), message)
+                    for name in team:
+                        self.assertEqual(team[name].can_move(), can_move(team[name]), message)
+                self.assertEqual(sorted(game.get_alive_players()), sorted(sum(alive.values(), [])), message)
+                for team in game.get_teams():
+                    enemies, allies = game.get_targets(team)
+                    expected_enemies = [name for title, names in alive.items() if title != team.title for name in names]
+                    self.assertEqual(sorted(enemies), sorted(expected_enemies), message)
+                    self.assertEqual(sorted(allies), sorted(alive[team.title]), message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from tests.common import scenario
+
+
+def recount(game):
+    """Standings and winners counted from scratch by scores of members.
+    """
+    scores = dict()
+    for team in game.get_teams():
+        scores[team.title] = sum(team[name].score for name in team)
+    standings = sorted(((title, score) for title, score in scores.items()), key=lambda ts: (ts[1], ts[0]), reverse=True)
+    max_score = max(scores.values())
+    return standings, {title: score for title, score in scores.items() if score == max_score}
+
+
+class Test_scores(unittest.TestCase):
+    def test_leaderboard_is_counted_incrementally(self):
+        for random_seed in range(5):
+            for step, game in scenario(random_seed):
+                standings, winners = recount(game)
+                message = f"seed {random_seed}, {step}"
+                for team in game.get_teams():
+                    self.assertEqual(team.get_score(), dict(standings)[team.title], message)
+                self.assertEqual(game.get_standings(), standings, message)
+                self.assertEqual(game.get_winners(), winners, message)
+
+
+if __name__ == "__main__":
+    unittest.main()
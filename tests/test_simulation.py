@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from Objects.Simulation import Scripted_policy, play_game, simulate
+
+TEAMS = {"a": ["a1", "a2"], "b": ["b1"]}
+SCRIPT = {
+    "a1": [((1, 1), "b1"), ((0, 1), None), ((1, 24), "a2")],
+    "a2": [((1, 12), "a1"), ((1, 2), "b1")],
+    "b1": [((1, 15), "a1"), ((1, 1), "a2"), ((1, 19), "b1"), ((0, 1), None)],
+}
+
+
+class Test_simulation(unittest.TestCase):
+    def test_results_do_not_depend_on_chunks(self):
+        # a scripted policy counts its steps, so it must not carry them from one game to another
+        expected = [play_game(seed, TEAMS, Scripted_policy(SCRIPT), rounds=10) for seed in range(5)]
+        for chunk_size in (1, 2, 5):
+            with self.subTest(chunk_size=chunk_size):
+                results = simulate(5, TEAMS, Scripted_policy(SCRIPT), rounds=10, workers=2, chunk_size=chunk_size)
+                self.assertEqual(sorted(results, key=lambda result: result["seed"]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
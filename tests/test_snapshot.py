@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+
+from Objects.Snapshot import Game_snapshot, dump_game, load_game, save_game
+from tests.common import game_state, make_game, play_round, silent_kwargs
+
+
+class Test_snapshot(unittest.TestCase):
+    def check_restored(self, game, restored) -> None:
+        """A restored game has the same state and plays the same rounds.
+        """
+        self.assertEqual(game_state(restored), game_state(game))
+        while not game.is_finished:
+            play_round(game)
+            play_round(restored)
+            self.assertEqual(game_state(restored), game_state(game), f"round {game.round}")
+        self.assertTrue(restored.is_finished)
+
+    def test_dump_and_restore(self):
+        for random_seed in range(5):
+            for rounds_played in (0, 1, 6):
+                with self.subTest(random_seed=random_seed, rounds_played=rounds_played):
+                    game = make_game(random_seed, rounds=15)
+                    for _ in range(rounds_played):
+                        play_round(game)
+                    restored = Game_snapshot(dump_game(game)).restore(**silent_kwargs())
+                    self.check_restored(game, restored)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.snapshot")
+            game = make_game(3, rounds=15)
+            for _ in range(4):
+                play_round(game)
+            save_game(game, path)
+            self.check_restored(game, load_game(path, **silent_kwargs()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+import unittest
+
+from Objects import Game, Player, Team, localization
+from Objects.IO_handler import Std_IO_handler
+from Objects.Spells import SPELLS, Spell_targets
+
+
+class Test_spells(unittest.TestCase):
+    def cast(self, spell: tuple) -> str:
+        """Plays a round where a caster uses a spell and returns the printed text.
+        """
+        stream = io.StringIO()
+        game = Game(teams=(Team("a", Player("caster", start_spells=(spell, )), Player("ally")), Team("b", Player("enemy"))),
+                    rounds=2, loglevel=logging.CRITICAL, messages=localization.RUS_TEXTS,
+                    io_handler=Std_IO_handler(out_stream=stream), random_seed=0)
+        spell_descr = SPELLS[spell]
+        if spell_descr.kind == Spell_targets.SELF:
+            target = "caster"
+        else:
+            target = "ally" if spell_descr.side == Spell_targets.ALLY else "enemy"
+        game.start_round()
+        stream.seek(0)
+        stream.truncate()
+        game.play_round({"caster": {"spell": spell, "target": target}})
+        return stream.getvalue(), target
+
+    def test_every_spell_is_printed(self):
+        for (level, index), spell_descr in SPELLS.items():
+            with self.subTest(spell=(level, index)):
+                text, target = self.cast((level, index))
+                messages = localization.RUS_TEXTS["spells"][level][index]
+                key = "self_message" if target == "caster" else "target_message"
+                self.assertIn(messages[key].format(player_name="caster", target_name=target), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from Objects import Player, Team
+from Objects.States import Player_group
+
+
+class Test_player_group(unittest.TestCase):
+    def test_duplicated_players_are_changed_once(self):
+        first, second = Player("a1"), Player("a2")
+        team = Team("a", first, second)
+        group = Player_group([first, second, first])
+        self.assertEqual(len(group), 2)
+        group.damage(5)
+        self.assertEqual(first.health_points, second.health_points)
+        self.assertEqual(team.get_score(), sum(p.health_points + p.mana_points for p in (first, second)))
+
+
+if __name__ == "__main__":
+    unittest.main()
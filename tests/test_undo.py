@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+
+from Objects.Bot import random_move
+from tests.common import game_state, make_game
+
+
+def make_moves(game, rng: random.Random) -> dict:
+    """Random moves of all alive players, they are chosen by another generator to keep the game's one untouched.
+    """
+    moves = dict()
+    for name in game.get_alive_players():
+        move = random_move(game, name, rng)
+        if move:
+            moves[name] = {"spell": move[0], "target": move[1]}
+    return moves
+
+def play(game, moves: dict) -> None:
+    game.start_round()
+    game.play_round({name: dict(move) for name, move in moves.items()})
+
+
+class Test_undo(unittest.TestCase):
+    def test_rollback(self):
+        game = make_game(5, rounds=40)
+        rng = random.Random(1)
+        for _ in range(30):
+            moves = make_moves(game, rng)
+            before = game_state(game)
+            mark = game.savepoint()
+            play(game, moves)
+            play(game, moves)
+            game.rollback(mark)
+            self.assertEqual(game_state(game), before, f"round {game.round}")
+            play(game, moves)
+
+    def test_nested_savepoints(self):
+        game = make_game(2, rounds=40)
+        rng = random.Random(2)
+        for _ in range(10):
+            before = game_state(game)
+            outer = game.savepoint()
+            play(game, make_moves(game, rng))
+            middle = game_state(game)
+            inner = game.savepoint()
+            play(game, make_moves(game, rng))
+            game.rollback(inner)
+            self.assertEqual(game_state(game), middle)
+            inner = game.savepoint()
+            play(game, make_moves(game, rng))
+            game.release(inner)
+            game.rollback(outer)
+            self.assertEqual(game_state(game), before)
+            # released changes stay
+            outer = game.savepoint()
+            play(game, make_moves(game, rng))
+            game.release(outer)
+
+    def test_fork_plays_as_game(self):
+        for random_seed in range(3):
+            game = make_game(random_seed, rounds=30)
+            rng = random.Random(random_seed)
+            for _ in range(3):
+                play(game, make_moves(game, rng))
+            fork = game.fork()
+            self.assertEqual(game_state(fork), game_state(game))
+            while not game.is_finished:
+                moves = make_moves(game, rng)
+                play(game, moves)
+                play(fork, moves)
+                self.assertEqual(game_state(fork), game_state(game), f"seed {random_seed}, round {game.round}")
+
+
+if __name__ == "__main__":
+    unittest.main()
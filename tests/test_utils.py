@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+
+from utils import Batched_random, _has_numpy
+
+
+class Test_batched_random(unittest.TestCase):
+    @unittest.skipIf(_has_numpy(), "NumPy is installed")
+    def test_without_numpy_as_random(self):
+        rng, expected = Batched_random(5), random.Random(5)
+        for _ in range(3):
+            rng.new_round()
+            self.assertEqual([rng.random() for _ in range(10)], [expected.random() for _ in range(10)])
+        self.assertEqual(rng.uniforms(5), [expected.random() for _ in range(5)])
+
+    def test_copy_between_rounds(self):
+        rng = Batched_random(7)
+        rng.random()
+        rng.new_round()
+        copy = rng.copy()
+        self.assertEqual([rng.random() for _ in range(300)], [copy.random() for _ in range(300)])
+
+
+if __name__ == "__main__":
+    unittest.main()
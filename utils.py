@@ -1,5 +1,67 @@
 import random
+from itertools import chain, islice
+from typing import Iterator
 
+# NumPy is optional and imported only when the first Batched_random is made
+_numpy = None
 
-def is_worked(chance: float) -> bool:
-    return random.random() <= chance
+
+def _has_numpy() -> bool:
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = False
+    return bool(_numpy)
+
+def is_worked(chance: float, rng: random.Random=random) -> bool:
+    return rng.random() <= chance
+
+
+class Batched_random(random.Random):
+    def __init__(self, seed: int=None, block_size: int=256) -> None:
+        """Random generator which draws uniforms by blocks. A new block is drawn by NumPy at the start of every round,
+        and random() hands out numbers of blocks without calls of Python code.
+        A block is seeded from the main generator, so states saved between rounds reproduce games exactly.
+        Without NumPy numbers are drawn one by one as by random.Random, because a block drawn by Python would only add calls.
+
+        Args:
+            seed (int, optional): A seed of the main generator. Defaults to None.
+            block_size (int, optional): A number of uniforms in a block. Defaults to 256.
+        """
+        self._block_size = block_size
+        super().__init__(seed)
+        self.new_round()
+
+    def _draw_block(self) -> list:
+        return _numpy.random.default_rng(self.getrandbits(64)).random(self._block_size).tolist()
+
+    def _draw_blocks(self) -> Iterator[list]:
+        while True:
+            yield self._draw_block()
+
+    def new_round(self) -> None:
+        """Drops the rest of the current block, the next number starts a new block.
+        """
+        if not _has_numpy():
+            return
+        self._uniforms = chain.from_iterable(self._draw_blocks())
+        # an instance attribute overrides the method, so a number is taken by a call of C code
+        self.random = self._uniforms.__next__
+
+    def uniforms(self, n: int) -> list:
+        """Returns n uniforms at once.
+        """
+        if not _has_numpy():
+            return [self.random() for _ in range(n)]
+        return list(islice(self._uniforms, n))
+
+    def copy(self) -> "Batched_random":
+        """Makes a generator with the same state of the main generator. A copy starts a new block.
+        """
+        rng = Batched_random.__new__(Batched_random)
+        rng._block_size = self._block_size
+        rng.setstate(self.getstate())
+        rng.new_round()
+        return rng